@@ -0,0 +1,109 @@
+# -----------------------------------------------------------------------------------------
+# Alcance.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa consultas de alcance limitado ("quem este post alcança?").
+
+# Perguntas respondidas:
+# - todos os usuários alcançáveis a partir de A com custo total <= orçamento
+# - os k usuários mais baratos de alcançar a partir de A
+# A busca para assim que o próximo vértice da fronteira passa do orçamento (ou k vértices
+# foram fechados). As estruturas são dicionários do tamanho da resposta (não listas de
+# tamanho V), então o custo é proporcional ao que foi alcançado, não ao grafo inteiro.
+# No modelo de saltos (pesos unitários) a busca é uma BFS em níveis.
+
+from heapq import heappush, heappop
+
+from Algoritmos import INF
+
+
+# Dijkstra limitado por orçamento e/ou quantidade.
+def _alcance_dijkstra(grafo, origem, orcamento, k):
+    custos = {origem: 0}
+    hops = {origem: 0}
+    fechados = set()
+    alcancados = []
+    heap = [(0, origem)]
+    while heap:
+        custo_atual, vertice_atual = heappop(heap)
+        if vertice_atual in fechados:
+            continue
+
+        # Fronteira passou do orçamento: nenhum vértice restante cabe nele.
+        if custo_atual > orcamento:
+            break
+        fechados.add(vertice_atual)
+        alcancados.append((vertice_atual, custo_atual, hops[vertice_atual]))
+        if k is not None and len(alcancados) >= k:
+            break
+
+        proximo_hop = hops[vertice_atual] + 1
+        for (vizinho, peso) in grafo.vizinhos(vertice_atual):
+            if vizinho in fechados:
+                continue
+            custo_alternativo = custo_atual + peso
+            # Vértices além do orçamento nem entram na fronteira.
+            if custo_alternativo <= orcamento and custo_alternativo < custos.get(vizinho, INF):
+                custos[vizinho] = custo_alternativo
+                hops[vizinho] = proximo_hop
+                heappush(heap, (custo_alternativo, vizinho))
+    return alcancados
+
+
+# BFS limitada (pesos unitários: custo = hops).
+def _alcance_bfs(grafo, origem, orcamento, k):
+    alcancados = [(origem, 0, 0)]
+    if k is not None and k <= 1:
+        return alcancados[:k]
+    vistos = {origem}
+    nivel = [origem]
+    distancia = 0
+    while nivel and distancia + 1 <= orcamento:
+        distancia += 1
+        proximo_nivel = []
+        for vertice_atual in nivel:
+            for (vizinho, _) in grafo.vizinhos(vertice_atual):
+                if vizinho not in vistos:
+                    vistos.add(vizinho)
+                    proximo_nivel.append(vizinho)
+                    alcancados.append((vizinho, distancia, distancia))
+                    if k is not None and len(alcancados) >= k:
+                        return alcancados
+        nivel = proximo_nivel
+    return alcancados
+
+
+def alcance(grafo, origem, orcamento=None, k=None):
+    """
+    Vértices alcançáveis a partir da origem com custo <= orcamento e/ou os k mais baratos
+    (a origem conta como um deles). Sem orçamento nem k, percorre toda a componente.
+
+    Retorna lista de (vertice, custo, hops) em ordem crescente de custo; hops é o número de
+    arestas do caminho de menor custo encontrado.
+    """
+    if orcamento is None:
+        orcamento = INF
+    if k is not None and k <= 0:
+        return []
+    if getattr(grafo, "pesosUnitarios", False):
+        return _alcance_bfs(grafo, origem, orcamento, k)
+    return _alcance_dijkstra(grafo, origem, orcamento, k)
+
+
+# Mesma consulta nos dois modelos do experimento.
+def alcance_viral(grafo_friccao, grafo_saltos, origem, orcamento_friccao=None, orcamento_saltos=None, k=None):
+    """
+    orcamento_friccao: custo máximo no modelo de fricção.
+    orcamento_saltos: número máximo de hops no modelo baseline.
+    k: limite de usuários em cada modelo.
+
+    Retorna {"friccao": [...], "saltos": [...]} com listas de (vertice, custo, hops).
+    """
+    return {
+        "friccao": alcance(grafo_friccao, origem, orcamento_friccao, k),
+        "saltos": alcance(grafo_saltos, origem, orcamento_saltos, k),
+    }
@@ -3,6 +3,8 @@
 # Implementação do algoritmo de Dijkstra conforme pseudocódigo
 # -----------------------------------------------------------------------------------------
 
+from heapq import heappush, heappop
+
 INF = float("inf") 
 
 def dijkstra(grafo, origem):
@@ -33,6 +35,230 @@ def dijkstra(grafo, origem):
     # retorna as listas dist e prev
     return distancias, predecessor
 
+# -----------------------------------------------------------------------------------------
+# Dijkstra com fila de prioridade (heap binário com remoção preguiçosa)
+# -----------------------------------------------------------------------------------------
+def dijkstra_heap(grafo, origem, destino=None, metricas=None):
+    """
+    Mesmo contrato de dijkstra(): retorna (distancias, predecessor).
+
+    Em vez de varrer todos os abertos a cada passo, usa um heap binário (heapq)
+    com remoção preguiçosa: entradas desatualizadas são descartadas ao sair do heap.
+    Custo O((V + E) log V).
+
+    Se destino for informado, a busca para assim que o destino é fechado; nesse caso
+    apenas as distâncias dos vértices já fechados são definitivas.
+
+    metricas: Instrumentacao.Metricas opcional; se informado, acumula vértices fechados,
+    relaxações, diminuições, push/pop no heap e a maior fronteira (sem ele, nada é contado).
+    """
+    total_vertices = grafo.numVertices
+    distancias = [INF] * total_vertices
+    predecessor = [None] * total_vertices
+    distancias[origem] = 0
+    predecessor[origem] = origem
+    fechados = [False] * total_vertices
+    heap = [(0, origem)]
+    relaxacoes = diminuicoes = max_fronteira = 0
+    while heap:
+        distancia_atual, vertice_atual = heappop(heap)
+
+        # entrada antiga (o vértice já foi fechado com distância menor)
+        if fechados[vertice_atual]:
+            continue
+        fechados[vertice_atual] = True
+
+        # parada antecipada: a distância do destino já é definitiva
+        if vertice_atual == destino:
+            break
+
+        for (vizinho, peso) in grafo.vizinhos(vertice_atual):
+            if not fechados[vizinho]:
+                if metricas is not None:
+                    relaxacoes += 1
+                distancia_alternativa = distancia_atual + peso
+                if distancias[vizinho] > distancia_alternativa:
+                    distancias[vizinho] = distancia_alternativa
+                    predecessor[vizinho] = vertice_atual
+                    heappush(heap, (distancia_alternativa, vizinho))
+                    if metricas is not None:
+                        diminuicoes += 1
+
+        if metricas is not None and len(heap) > max_fronteira:
+            max_fronteira = len(heap)
+
+    if metricas is not None:
+        # Cada diminuição é um push (mais o da origem); pops = pushes - entradas restantes.
+        metricas.assentados += fechados.count(True)
+        metricas.relaxacoes += relaxacoes
+        metricas.diminuicoes += diminuicoes
+        metricas.pushes += diminuicoes + 1
+        metricas.pops += diminuicoes + 1 - len(heap)
+        metricas.max_fronteira = max(metricas.max_fronteira, max_fronteira, 1)
+
+    return distancias, predecessor
+
+# -----------------------------------------------------------------------------------------
+# Dijkstra bidirecional (consulta ponto a ponto)
+# -----------------------------------------------------------------------------------------
+def dijkstra_bidirecional(grafo, origem, destino, grafo_reverso=None):
+    """
+    Consulta ponto a ponto: cresce uma fronteira a partir da origem e outra a partir
+    do destino até que se encontrem.
+
+    Retorna (custo, predecessor), onde predecessor é compatível com
+    reconstruir_caminho_prev(predecessor, origem, destino). Apenas a cadeia que
+    leva ao destino é garantida; o custo é INF se não existir caminho.
+
+    A busca reversa percorre grafo_reverso; por padrão usa o próprio grafo, o que
+    vale para os grafos não-direcionados de gerar_rede_social.
+    """
+    if grafo_reverso is None:
+        grafo_reverso = grafo
+
+    total_vertices = grafo.numVertices
+    predecessor = [None] * total_vertices
+    predecessor[origem] = origem
+    if origem == destino:
+        return 0, predecessor
+
+    # índice 0 = busca direta (origem), índice 1 = busca reversa (destino)
+    grafos = (grafo, grafo_reverso)
+    distancias = ([INF] * total_vertices, [INF] * total_vertices)
+    anteriores = ([None] * total_vertices, [None] * total_vertices)
+    fechados = ([False] * total_vertices, [False] * total_vertices)
+    heaps = ([(0, origem)], [(0, destino)])
+    distancias[0][origem] = 0
+    distancias[1][destino] = 0
+
+    # melhor custo conhecido (mu) e vértice de encontro das duas buscas
+    melhor_custo = INF
+    encontro = None
+
+    while heaps[0] and heaps[1]:
+        # critério de parada: nenhuma ligação futura pode melhorar mu
+        if heaps[0][0][0] + heaps[1][0][0] >= melhor_custo:
+            break
+
+        # expande o lado com a menor fronteira (mantém as buscas equilibradas)
+        lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        outro = 1 - lado
+        distancia_atual, vertice_atual = heappop(heaps[lado])
+        if fechados[lado][vertice_atual]:
+            continue
+        fechados[lado][vertice_atual] = True
+
+        dist_lado = distancias[lado]
+        dist_outro = distancias[outro]
+        for (vizinho, peso) in grafos[lado].vizinhos(vertice_atual):
+            distancia_alternativa = distancia_atual + peso
+            if dist_lado[vizinho] > distancia_alternativa:
+                dist_lado[vizinho] = distancia_alternativa
+                anteriores[lado][vizinho] = vertice_atual
+                heappush(heaps[lado], (distancia_alternativa, vizinho))
+
+            # aresta que liga as duas árvores: candidata a melhorar mu
+            candidato = dist_lado[vizinho] + dist_outro[vizinho]
+            if candidato < melhor_custo:
+                melhor_custo = candidato
+                encontro = vizinho
+
+    if encontro is None:
+        return INF, predecessor
+
+    # trecho origem -> encontro: predecessores da busca direta
+    vertice_atual = encontro
+    while vertice_atual != origem:
+        predecessor[vertice_atual] = anteriores[0][vertice_atual]
+        vertice_atual = anteriores[0][vertice_atual]
+
+    # trecho encontro -> destino: inverte os "sucessores" da busca reversa
+    vertice_atual = encontro
+    while vertice_atual != destino:
+        proximo = anteriores[1][vertice_atual]
+        predecessor[proximo] = vertice_atual
+        vertice_atual = proximo
+
+    return melhor_custo, predecessor
+
+# -----------------------------------------------------------------------------------------
+# Busca em largura (BFS) para grafos com peso 1 em todas as arestas
+# -----------------------------------------------------------------------------------------
+def bfs(grafo, origem, destino=None, metricas=None):
+    """
+    Mesmo contrato de dijkstra(): retorna (distancias, predecessor).
+
+    Só é correta quando todas as arestas têm peso 1 (ex.: grafo_saltos). Nesse caso a
+    ordem de descoberta já é a ordem de distância, então não há fila de prioridade: O(V + E).
+    Se destino for informado, a busca para assim que o destino é descoberto.
+
+    metricas: como em dijkstra_heap (push/pop contam entradas e saídas da fila).
+    """
+    total_vertices = grafo.numVertices
+    distancias = [INF] * total_vertices
+    predecessor = [None] * total_vertices
+    distancias[origem] = 0
+    predecessor[origem] = origem
+    if origem == destino:
+        if metricas is not None:
+            metricas.assentados += 1
+        return distancias, predecessor
+
+    # lista usada como fila: o índice "inicio" avança em vez de remover do começo
+    fila = [origem]
+    inicio = 0
+    relaxacoes = 0
+    max_fronteira = 1
+    while inicio < len(fila):
+        vertice_atual = fila[inicio]
+        inicio += 1
+        proxima_distancia = distancias[vertice_atual] + 1
+        if metricas is not None:
+            # relaxações contadas por vértice (o laço interno fica sem desvio extra)
+            relaxacoes += grafo.grau(vertice_atual)
+        for (vizinho, _) in grafo.vizinhos(vertice_atual):
+            if predecessor[vizinho] is None:
+                distancias[vizinho] = proxima_distancia
+                predecessor[vizinho] = vertice_atual
+                if vizinho == destino:
+                    if metricas is not None:
+                        # vizinhos depois do destino não chegaram a ser examinados
+                        for posicao, (vertice, _) in enumerate(grafo.vizinhos(vertice_atual)):
+                            if vertice == destino:
+                                relaxacoes -= grafo.grau(vertice_atual) - posicao - 1
+                                break
+                        # o destino conta como descoberto (entraria na fila)
+                        fronteira = max(max_fronteira, len(fila) + 1 - inicio)
+                        _registrar_bfs(metricas, len(fila) + 1, inicio, relaxacoes, fronteira)
+                    return distancias, predecessor
+                fila.append(vizinho)
+        if metricas is not None and len(fila) - inicio > max_fronteira:
+            max_fronteira = len(fila) - inicio
+
+    if metricas is not None:
+        _registrar_bfs(metricas, len(fila), inicio, relaxacoes, max_fronteira)
+    return distancias, predecessor
+
+# Função interna: contadores da BFS (cada descoberta é definitiva: diminuições = descobertas).
+def _registrar_bfs(metricas, descobertos, retirados, relaxacoes, max_fronteira):
+    metricas.assentados += retirados
+    metricas.relaxacoes += relaxacoes
+    metricas.diminuicoes += descobertos - 1
+    metricas.pushes += descobertos
+    metricas.pops += retirados
+    metricas.max_fronteira = max(metricas.max_fronteira, max_fronteira)
+
+# -----------------------------------------------------------------------------------------
+# Seleção automática do motor de caminhos mínimos
+# -----------------------------------------------------------------------------------------
+def caminhos_minimos(grafo, origem, destino=None, metricas=None):
+    # Grafo marcado como de pesos unitários (ex.: grafo_saltos): BFS basta.
+    if getattr(grafo, "pesosUnitarios", False):
+        return bfs(grafo, origem, destino, metricas)
+
+    # Caso geral (ex.: grafo_friccao): Dijkstra com heap.
+    return dijkstra_heap(grafo, origem, destino, metricas)
+
 # -----------------------------
 # Reconstrução de Caminho (prev por vértice)
 # -----------------------------
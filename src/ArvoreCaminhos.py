@@ -0,0 +1,184 @@
+# -----------------------------------------------------------------------------------------
+# ArvoreCaminhos.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa a árvore de caminhos mínimos compacta e a reconstrução em lote.
+
+# Os motores devolvem listas Python (float/INF e predecessores com None). Aqui a árvore de
+# uma origem vira vetores tipados:
+# - distancias: array('d') (float64), INF para não alcançados
+# - predecessor: array('i') (int32), -1 para não alcançados; predecessor[origem] = origem
+# Em vez de reconstruir_caminho_prev destino a destino (repetindo os prefixos comuns):
+# - profundidades(destinos): hops de todos os destinos pedidos em uma passada (memoizada)
+# - caminhos(destinos): caminhos de todos os destinos pedidos; cada vértice da árvore é
+#   percorrido uma única vez e os prefixos comuns são copiados (fatia) do caminho já montado
+# - filhos(): a árvore exportada em formato CSR (offsets + filhos)
+# Com NumPy instalado (opcional), como_numpy() devolve os vetores como np.ndarray.
+
+from array import array
+
+from Algoritmos import caminhos_minimos
+
+try:
+    import numpy as np
+except ImportError:  # NumPy não instalado
+    np = None
+
+# Sentinela de "sem predecessor" nos vetores compactos.
+SEM_PREDECESSOR = -1
+
+# Marcas internas do cálculo de profundidades.
+_NAO_CALCULADA = -2
+_EM_ANDAMENTO = -3
+
+
+# Converte a saída (distancias, predecessor) de um motor para vetores tipados.
+def compactar(distancias, predecessor):
+    distancias_compactas = array("d", distancias)
+    predecessor_compacto = array("i", [SEM_PREDECESSOR if p is None else p for p in predecessor])
+    return distancias_compactas, predecessor_compacto
+
+
+class ArvoreCaminhos:
+    def __init__(self, origem, distancias, predecessor):
+        # distancias: array('d'); predecessor: array('i') com -1 para não alcançados.
+        self.origem = origem
+        self.distancias = distancias
+        self.predecessor = predecessor
+        self.numVertices = len(predecessor)
+
+    def alcancado(self, v):
+        return self.predecessor[v] != SEM_PREDECESSOR
+
+    def caminho(self, destino):
+        # Um destino (mesmo resultado de reconstruir_caminho_prev).
+        return self.caminhos([destino])[destino]
+
+    def profundidades(self, destinos=None):
+        """
+        Hops da origem até cada destino pedido (todos, se destinos=None), em uma passada:
+        cada vértice da árvore tem a profundidade calculada uma única vez.
+        Retorna array('i') com -1 para não alcançados; vértices não pedidos ficam com -1,
+        exceto os ancestrais dos pedidos (calculados no caminho).
+        """
+        predecessor = self.predecessor
+        profundidade = array("i", [_NAO_CALCULADA]) * self.numVertices
+        profundidade[self.origem] = 0
+
+        for destino in (range(self.numVertices) if destinos is None else destinos):
+            # Sobe até um vértice já calculado, empilhando o trecho.
+            pilha = []
+            v = destino
+            while profundidade[v] == _NAO_CALCULADA:
+                profundidade[v] = _EM_ANDAMENTO
+                pilha.append(v)
+                v = predecessor[v]
+                if v == SEM_PREDECESSOR:
+                    break
+
+            # Base: profundidade do vértice onde a subida parou (-1 se não alcançável ou ciclo).
+            if v == SEM_PREDECESSOR or profundidade[v] < 0:
+                base = -1
+            else:
+                base = profundidade[v]
+
+            # Desce preenchendo o trecho empilhado.
+            while pilha:
+                v = pilha.pop()
+                base = base + 1 if base >= 0 else -1
+                profundidade[v] = base
+
+        # Vértices não visitados ficam como -1.
+        for v in range(self.numVertices):
+            if profundidade[v] < 0:
+                profundidade[v] = -1
+        return profundidade
+
+    def caminhos(self, destinos):
+        """
+        Retorna {destino: caminho} (lista origem -> destino; [] se não alcançável).
+        Cada vértice da árvore é percorrido uma única vez: a subida de um destino para no
+        primeiro vértice que já pertence a um caminho montado, e o prefixo até ele é copiado
+        (fatia) desse caminho. Custo O(vértices percorridos + tamanho da resposta), sem
+        guardar um caminho por vértice intermediário.
+        """
+        predecessor = self.predecessor
+        # montados[k] = k-ésimo caminho montado (None = sem caminho); dono[v] = k do caminho
+        # que passa por v (-1 = ainda não percorrido). dono[-1] (posição extra) captura a
+        # subida que chega em SEM_PREDECESSOR.
+        montados = [None, [self.origem]]
+        dono = [-1] * (self.numVertices + 1)
+        dono[-1] = 0
+        dono[self.origem] = 1
+        resultado = {}
+        for destino in destinos:
+            # Sobe marcando o trecho com o índice do novo caminho, até um vértice já marcado.
+            k = len(montados)
+            trecho = []
+            v = destino
+            while dono[v] < 0:
+                dono[v] = k
+                trecho.append(v)
+                v = predecessor[v]
+
+            # Predecessor inconsistente (ex.: árvore parcial, ciclo) ou não alcançável.
+            caminho_dono = montados[dono[v]] if dono[v] != k else None
+            if caminho_dono is None:
+                montados.append(None)
+                resultado[destino] = []
+                continue
+
+            # Prefixo copiado do caminho dono de v + o trecho percorrido (na ordem da origem).
+            caminho = caminho_dono[:caminho_dono.index(v) + 1]
+            trecho.reverse()
+            caminho.extend(trecho)
+            montados.append(caminho)
+            resultado[destino] = caminho
+        return resultado
+
+    def filhos(self):
+        """
+        Exporta a árvore em CSR: filhos de v em filhos[offsets[v]:offsets[v + 1]]
+        (array('q') e array('i')). A origem não aparece como filha de si mesma.
+        """
+        predecessor = self.predecessor
+        offsets = array("q", [0]) * (self.numVertices + 1)
+        for v, p in enumerate(predecessor):
+            if p != SEM_PREDECESSOR and v != self.origem:
+                offsets[p + 1] += 1
+        for v in range(self.numVertices):
+            offsets[v + 1] += offsets[v]
+
+        proxima = array("q", offsets)
+        filhos = array("i", [0]) * offsets[self.numVertices]
+        for v, p in enumerate(predecessor):
+            if p != SEM_PREDECESSOR and v != self.origem:
+                filhos[proxima[p]] = v
+                proxima[p] += 1
+        return offsets, filhos
+
+    def como_numpy(self):
+        # (distancias float64, predecessor int32) como np.ndarray, sem cópia.
+        if np is None:
+            raise ImportError("como_numpy requer NumPy (pip install numpy).")
+        return (
+            np.frombuffer(self.distancias, dtype=np.float64),
+            np.frombuffer(self.predecessor, dtype=np.int32),
+        )
+
+    def memoriaBytes(self):
+        return self.distancias.itemsize * len(self.distancias) + self.predecessor.itemsize * len(self.predecessor)
+
+
+# Roda o motor e devolve a árvore compacta da origem.
+def arvore_caminhos_minimos(grafo, origem, destino=None, motor=caminhos_minimos):
+    """
+    motor: qualquer motor com o contrato (distancias, predecessor) (padrão: caminhos_minimos).
+    Com destino informado a busca pode parar cedo: só o caminho até o destino é definitivo.
+    """
+    distancias, predecessor = motor(grafo, origem, destino)
+    return ArvoreCaminhos(origem, *compactar(distancias, predecessor))
@@ -0,0 +1,109 @@
+# -----------------------------------------------------------------------------------------
+# CacheCaminhos.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa um cache LRU de árvores de caminhos mínimos.
+
+# Cada entrada guarda (distancias, predecessor) de uma origem em um grafo/camada.
+# Chave: (id do grafo, camada, origem). A entrada registra a "versao" do grafo no momento
+# do cálculo; qualquer addAresta incrementa a versão e a entrada deixa de valer.
+# Despejo LRU limitado por quantidade de entradas e por memória estimada.
+
+from collections import OrderedDict
+from sys import getsizeof
+
+from Algoritmos import caminhos_minimos
+
+
+# Função interna que identifica (grafo base, camada) de um grafo ou visão de camada.
+def _identificar(grafo):
+    # CamadaGrafo: o grafo base é o GrafoCamadas e a camada é o nome da visão.
+    if hasattr(grafo, "grafo") and hasattr(grafo, "nome"):
+        return id(grafo.grafo), grafo.nome
+    return id(grafo), None
+
+
+# Função interna que estima a memória de uma árvore (listas + objetos float das distâncias).
+def _estimar_bytes(distancias, predecessor):
+    return getsizeof(distancias) + getsizeof(predecessor) + 24 * len(distancias)
+
+
+class CacheArvores:
+    def __init__(self, max_entradas=128, max_bytes=None, motor=caminhos_minimos):
+        # Limites de despejo (max_bytes=None desliga o limite de memória).
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+
+        # Motor usado nas faltas (mesmo contrato de dijkstra: retorna (distancias, predecessor)).
+        self.motor = motor
+
+        # chave -> (grafo, versao, distancias, predecessor, bytes)
+        self.entradas = OrderedDict()
+        self.bytes = 0
+
+        # Estatísticas para dimensionar o cache.
+        self.acertos = 0
+        self.faltas = 0
+        self.invalidacoes = 0
+        self.despejos = 0
+
+    def caminhos_minimos(self, grafo, origem):
+        """
+        Retorna (distancias, predecessor) da origem no grafo, do cache quando possível.
+        As listas retornadas são compartilhadas com o cache: não devem ser modificadas.
+        """
+        id_grafo, camada = _identificar(grafo)
+        chave = (id_grafo, camada, origem)
+        versao = getattr(grafo, "versao", 0)
+
+        entrada = self.entradas.get(chave)
+        if entrada is not None:
+            # A chave usa id(): confere se é o mesmo objeto e se o grafo não mudou.
+            if entrada[0] is grafo and entrada[1] == versao:
+                self.acertos += 1
+                self.entradas.move_to_end(chave)
+                return entrada[2], entrada[3]
+            self.invalidacoes += 1
+            self._remover(chave)
+
+        self.faltas += 1
+        distancias, predecessor = self.motor(grafo, origem)
+        tamanho = _estimar_bytes(distancias, predecessor)
+        self.entradas[chave] = (grafo, versao, distancias, predecessor, tamanho)
+        self.bytes += tamanho
+        self._despejar()
+        return distancias, predecessor
+
+    def _remover(self, chave):
+        entrada = self.entradas.pop(chave)
+        self.bytes -= entrada[4]
+
+    def _despejar(self):
+        # Remove as entradas menos usadas até respeitar os limites (mantém ao menos a mais recente).
+        while len(self.entradas) > 1 and (
+            len(self.entradas) > self.max_entradas
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            chave = next(iter(self.entradas))
+            self._remover(chave)
+            self.despejos += 1
+
+    def limpar(self):
+        self.entradas.clear()
+        self.bytes = 0
+
+    def estatisticas(self):
+        consultas = self.acertos + self.faltas
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "invalidacoes": self.invalidacoes,
+            "despejos": self.despejos,
+            "entradas": len(self.entradas),
+            "bytes": self.bytes,
+        }
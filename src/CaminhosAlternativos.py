@@ -0,0 +1,166 @@
+# -----------------------------------------------------------------------------------------
+# CaminhosAlternativos.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa as k rotas mais baratas e sem ciclos entre A e B (algoritmo de Yen).
+
+# Yen: a i-ésima rota é derivada das anteriores. Para cada vértice "spur" da última rota
+# aceita, fixa-se o trecho raiz (origem..spur), bloqueiam-se os vértices da raiz e as arestas
+# que saem do spur usadas por rotas já aceitas com a mesma raiz, e busca-se o melhor desvio
+# spur -> destino. Os candidatos vão para um heap; o mais barato vira a próxima rota.
+# Em vez de um Dijkstra completo por spur:
+# - a árvore reversa (caminhos mínimos a partir do destino) é calculada uma única vez
+# - se o caminho da árvore a partir do spur não toca nada bloqueado, ele já é o desvio ótimo
+#   (nenhuma busca)
+# - caso contrário, A* usando a distância da árvore reversa como heurística (admissível:
+#   bloquear vértices/arestas só aumenta distâncias), limitado pelo custo do candidato que
+#   ainda seria aceito (desvios mais caros não têm chance)
+# - max_relaxacoes limita o trabalho total da consulta
+
+from heapq import heappush, heappop, nsmallest
+
+from Algoritmos import INF, caminhos_minimos
+
+
+# Função interna: caminho da árvore reversa a partir de v (None se tocar vértice bloqueado).
+def _caminho_pela_arvore(sucessor, v, destino, bloqueados):
+    caminho = [v]
+    while v != destino:
+        v = sucessor[v]
+        if v is None or v in bloqueados:
+            return None
+        caminho.append(v)
+    return caminho
+
+
+# Função interna: A* do spur até o destino evitando vértices/arestas bloqueados.
+def _busca_desvio(grafo, spur, destino, restante, bloqueados, arestas_bloqueadas, limite, trabalho):
+    custos = {spur: 0}
+    anteriores = {spur: None}
+    fechados = set()
+    heap = [(restante[spur], 0, spur)]
+    while heap:
+        estimativa, custo_atual, vertice_atual = heappop(heap)
+        if vertice_atual in fechados:
+            continue
+        # Limite: nenhum desvio a partir daqui pode ser aceito.
+        if estimativa > limite or trabalho["relaxacoes"] >= trabalho["maximo"]:
+            return None
+        fechados.add(vertice_atual)
+
+        if vertice_atual == destino:
+            caminho = []
+            acumulados = []
+            while vertice_atual is not None:
+                caminho.append(vertice_atual)
+                acumulados.append(custos[vertice_atual])
+                vertice_atual = anteriores[vertice_atual]
+            caminho.reverse()
+            acumulados.reverse()
+            return caminho, acumulados
+
+        for (vizinho, peso) in grafo.vizinhos(vertice_atual):
+            if vizinho in bloqueados or vizinho in fechados:
+                continue
+            if vertice_atual == spur and vizinho in arestas_bloqueadas:
+                continue
+            trabalho["relaxacoes"] += 1
+            custo_alternativo = custo_atual + peso
+            if custo_alternativo < custos.get(vizinho, INF) and restante[vizinho] != INF:
+                custos[vizinho] = custo_alternativo
+                anteriores[vizinho] = vertice_atual
+                heappush(heap, (custo_alternativo + restante[vizinho], custo_alternativo, vizinho))
+    return None
+
+
+def k_caminhos_minimos(grafo, origem, destino, k, max_relaxacoes=None, grafo_reverso=None, estatisticas=None):
+    """
+    Até k rotas sem ciclos, da mais barata para a mais cara.
+
+    grafo_reverso: grafo para a árvore reversa (padrão: o próprio grafo, não-direcionado).
+    max_relaxacoes: teto de relaxações de aresta somando todas as buscas de desvio; ao
+                    atingi-lo, retorna só as rotas já confirmadas (podem ser menos que k).
+    estatisticas: se for um dict, recebe "buscas", "atalhos_arvore", "relaxacoes" e
+                  "interrompida".
+
+    Retorna lista de (custo, caminho).
+    """
+    if grafo_reverso is None:
+        grafo_reverso = grafo
+    trabalho = {"relaxacoes": 0, "maximo": INF if max_relaxacoes is None else max_relaxacoes}
+    buscas = 0
+    atalhos = 0
+
+    # Árvore reversa: restante[v] = custo mínimo v -> destino; sucessor[v] = próximo vértice.
+    restante, sucessor = caminhos_minimos(grafo_reverso, destino)
+    rotas = []
+    if k > 0 and restante[origem] != INF:
+        caminho = _caminho_pela_arvore(sucessor, origem, destino, ())
+        # rotas[i] = (custo, caminho, custo acumulado em cada vértice do caminho)
+        rotas.append((restante[origem], caminho, [restante[origem] - restante[v] for v in caminho]))
+
+    candidatos = []
+    vistos = {tuple(rotas[0][1])} if rotas else set()
+    while rotas and len(rotas) < k and trabalho["relaxacoes"] < trabalho["maximo"]:
+        _, ultimo, acumulados_ultimo = rotas[-1]
+
+        for i in range(len(ultimo) - 1):
+            spur = ultimo[i]
+            raiz = ultimo[:i + 1]
+            custo_raiz = acumulados_ultimo[i]
+
+            # Arestas spur -> x usadas por rotas já aceitas com a mesma raiz.
+            arestas_bloqueadas = {
+                caminho[i + 1] for _, caminho, _ in rotas if len(caminho) > i + 1 and caminho[:i + 1] == raiz
+            }
+            bloqueados = set(raiz[:-1])
+
+            # Custo máximo útil: o candidato que ainda seria aceito entre os que faltam.
+            faltam = k - len(rotas)
+            limite = INF
+            if len(candidatos) >= faltam:
+                limite = nsmallest(faltam, candidatos)[-1][0] - custo_raiz
+
+            desvio = None
+            proximo = sucessor[spur]
+            if proximo is not None and proximo not in arestas_bloqueadas:
+                trecho = _caminho_pela_arvore(sucessor, spur, destino, bloqueados)
+                if trecho is not None:
+                    atalhos += 1
+                    desvio = (trecho, [restante[spur] - restante[v] for v in trecho])
+            if desvio is None:
+                if trabalho["relaxacoes"] >= trabalho["maximo"]:
+                    break
+                buscas += 1
+                desvio = _busca_desvio(
+                    grafo, spur, destino, restante, bloqueados, arestas_bloqueadas, limite, trabalho
+                )
+            if desvio is None:
+                continue
+
+            trecho, acumulados_trecho = desvio
+            caminho = raiz[:-1] + trecho
+            chave = tuple(caminho)
+            if chave in vistos:
+                continue
+            vistos.add(chave)
+            acumulados = acumulados_ultimo[:i] + [custo_raiz + a for a in acumulados_trecho]
+            heappush(candidatos, (acumulados[-1], caminho, acumulados))
+
+        # Com a rodada interrompida, o melhor candidato pode não ser a próxima rota de fato.
+        if not candidatos or trabalho["relaxacoes"] >= trabalho["maximo"]:
+            break
+        rotas.append(heappop(candidatos))
+
+    if estatisticas is not None:
+        estatisticas.update({
+            "buscas": buscas,
+            "atalhos_arvore": atalhos,
+            "relaxacoes": trabalho["relaxacoes"],
+            "interrompida": len(rotas) < k and trabalho["relaxacoes"] >= trabalho["maximo"],
+        })
+    return [(custo, caminho) for custo, caminho, _ in rotas]
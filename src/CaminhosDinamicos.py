@@ -0,0 +1,169 @@
+# -----------------------------------------------------------------------------------------
+# CaminhosDinamicos.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo mantém árvores de caminhos mínimos enquanto a rede muda.
+
+# Atualizações suportadas (sempre nas duas direções, rede não-direcionada):
+# - mudança de interação de uma aresta (recalcula o peso de fricção)
+# - inserção e remoção de aresta
+# Reparo incremental (no estilo de Ramalingam-Reps), sem recalcular a árvore inteira:
+# - peso diminuiu / aresta nova: propaga a melhora a partir do extremo beneficiado,
+#   visitando só os vértices cuja distância de fato diminui
+# - peso aumentou / aresta removida: só importa se a aresta é da árvore; nesse caso a
+#   subárvore abaixo dela é desfeita e recalculada a partir da sua "borda" (vizinhos de fora)
+
+from heapq import heappush, heappop
+
+from Algoritmos import INF, caminhos_minimos
+from RedeSocial import _peso_friccao
+
+
+class RedeDinamica:
+    def __init__(self, grafo, friccao_alpha=8.0):
+        # GrafoCamadas com as camadas "saltos", "friccao" e "interacao".
+        self.grafo = grafo
+        self.friccao_alpha = friccao_alpha
+
+        # (camada, origem) -> [distancias, predecessor] mantidos a cada atualização.
+        self.arvores = {}
+
+        # Quantidade de vértices revisitados nos reparos (para comparar com recálculo total).
+        self.vertices_reparados = 0
+
+    def arvore(self, origem, camada="friccao"):
+        # Calcula (uma vez) e passa a manter a árvore da origem nessa camada.
+        chave = (camada, origem)
+        if chave not in self.arvores:
+            distancias, predecessor = caminhos_minimos(self.grafo.camada(camada), origem)
+            self.arvores[chave] = [distancias, predecessor]
+        distancias, predecessor = self.arvores[chave]
+        return distancias, predecessor
+
+    def descartar(self, origem, camada="friccao"):
+        self.arvores.pop((camada, origem), None)
+
+    # -----------------------------
+    # Atualizações da rede
+    # -----------------------------
+    def atualizar_interacao(self, u, v, interacao):
+        pesos_antigos = {camada: self._peso(u, v, camada) for camada, _ in self.arvores}
+        peso = _peso_friccao(interacao, self.friccao_alpha)
+        self.grafo.alterarAresta(u, v, friccao=peso, interacao=interacao)
+        self.grafo.alterarAresta(v, u, friccao=peso, interacao=interacao)
+
+        # Camadas cujo peso não mudou (ex.: saltos) não são reparadas.
+        for (camada, origem), arvore in self.arvores.items():
+            self._reparar(camada, arvore, u, v, pesos_antigos[camada], self._peso(u, v, camada))
+
+    def inserir_aresta(self, u, v, interacao):
+        peso = _peso_friccao(interacao, self.friccao_alpha)
+        # Grafo indexado rejeita aresta já existente: nada muda, nada a reparar.
+        if not self.grafo.addAresta(u, v, saltos=1, friccao=peso, interacao=interacao):
+            return
+        self.grafo.addAresta(v, u, saltos=1, friccao=peso, interacao=interacao)
+
+        for (camada, origem), arvore in self.arvores.items():
+            self._reparar(camada, arvore, u, v, INF, self._peso(u, v, camada))
+
+    def remover_aresta(self, u, v):
+        pesos_antigos = {camada: self._peso(u, v, camada) for camada, _ in self.arvores}
+        self.grafo.removerAresta(u, v)
+        self.grafo.removerAresta(v, u)
+
+        for (camada, origem), arvore in self.arvores.items():
+            self._reparar(camada, arvore, u, v, pesos_antigos[camada], INF)
+
+    # -----------------------------
+    # Reparo das árvores
+    # -----------------------------
+    def _peso(self, u, v, camada):
+        i = self.grafo.lista[u].index(v)
+        return self.grafo.pesos[camada][u][i]
+
+    def _reparar(self, camada, arvore, u, v, peso_antigo, peso_novo):
+        if peso_novo < peso_antigo:
+            self._reparar_diminuicao(camada, arvore, u, v, peso_novo)
+        elif peso_novo > peso_antigo:
+            self._reparar_aumento(camada, arvore, u, v)
+
+    def _reparar_diminuicao(self, camada, arvore, u, v, peso):
+        distancias, predecessor = arvore
+        grafo = self.grafo.camada(camada)
+
+        # A aresta (u, v) pode encurtar o caminho até v (via u) ou até u (via v).
+        heap = []
+        for a, b in ((u, v), (v, u)):
+            if distancias[a] + peso < distancias[b]:
+                distancias[b] = distancias[a] + peso
+                predecessor[b] = a
+                heappush(heap, (distancias[b], b))
+
+        # Propaga a melhora (Dijkstra restrito aos vértices que melhoram).
+        while heap:
+            distancia_atual, vertice_atual = heappop(heap)
+            if distancia_atual > distancias[vertice_atual]:
+                continue
+            self.vertices_reparados += 1
+            for (vizinho, peso_aresta) in grafo.vizinhos(vertice_atual):
+                distancia_alternativa = distancia_atual + peso_aresta
+                if distancia_alternativa < distancias[vizinho]:
+                    distancias[vizinho] = distancia_alternativa
+                    predecessor[vizinho] = vertice_atual
+                    heappush(heap, (distancia_alternativa, vizinho))
+
+    def _reparar_aumento(self, camada, arvore, u, v):
+        distancias, predecessor = arvore
+        grafo = self.grafo.camada(camada)
+
+        # Se (u, v) não é aresta da árvore, nenhum caminho mínimo a usa.
+        if predecessor[v] == u:
+            raiz = v
+        elif predecessor[u] == v:
+            raiz = u
+        else:
+            return
+
+        # Subárvore afetada: filhos são vizinhos cujo predecessor é o vértice atual.
+        afetados = {raiz}
+        pilha = [raiz]
+        while pilha:
+            vertice_atual = pilha.pop()
+            for (vizinho, _) in grafo.vizinhos(vertice_atual):
+                if predecessor[vizinho] == vertice_atual and vizinho not in afetados:
+                    afetados.add(vizinho)
+                    pilha.append(vizinho)
+
+        # Desfaz a subárvore.
+        for x in afetados:
+            distancias[x] = INF
+            predecessor[x] = None
+
+        # Borda: melhor ligação de cada afetado a partir de vértices não afetados.
+        heap = []
+        for x in afetados:
+            for (vizinho, peso_aresta) in grafo.vizinhos(x):
+                if vizinho not in afetados and distancias[vizinho] + peso_aresta < distancias[x]:
+                    distancias[x] = distancias[vizinho] + peso_aresta
+                    predecessor[x] = vizinho
+            if distancias[x] != INF:
+                heappush(heap, (distancias[x], x))
+
+        # Dijkstra restrito aos afetados (os demais não podem melhorar com um aumento).
+        while heap:
+            distancia_atual, vertice_atual = heappop(heap)
+            if distancia_atual > distancias[vertice_atual]:
+                continue
+            self.vertices_reparados += 1
+            for (vizinho, peso_aresta) in grafo.vizinhos(vertice_atual):
+                if vizinho not in afetados:
+                    continue
+                distancia_alternativa = distancia_atual + peso_aresta
+                if distancia_alternativa < distancias[vizinho]:
+                    distancias[vizinho] = distancia_alternativa
+                    predecessor[vizinho] = vertice_atual
+                    heappush(heap, (distancia_alternativa, vizinho))
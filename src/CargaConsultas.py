@@ -0,0 +1,161 @@
+# -----------------------------------------------------------------------------------------
+# CargaConsultas.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo gera cargas de consultas (pares origem/destino) para testes de carga.
+
+# Em vez de varrer comunidade_por_no a cada par (como os seletores do Main.py), um índice é
+# montado uma única vez:
+# - nós por comunidade
+# - faixa de grau de cada nó (faixas por quantis da distribuição de graus)
+# - nós por faixa de grau
+# A partir dele, gerar_pares entrega em fluxo (gerador) quantos pares forem pedidos,
+# determinísticos pela seed e estratificados por:
+# - tipo: "intra" (mesma comunidade) ou "inter" (comunidades diferentes)
+# - faixa de grau da origem
+# - restrição opcional "sem aresta direta" (evita pares de 1 hop)
+
+import random
+from bisect import bisect_right
+from itertools import islice
+
+# Quantidade padrão de faixas de grau (quartis).
+NUM_FAIXAS_GRAU = 4
+
+# Tentativas de sorteio do destino antes de descartar a origem (restrição "sem aresta").
+TENTATIVAS_DESTINO = 32
+
+# Origens descartadas seguidas antes de desistir (estratos impossíveis no grafo).
+MAX_DESCARTES_SEGUIDOS = 1000
+
+
+class IndiceComunidades:
+    def __init__(self, comunidade_por_no, grafo, num_faixas=NUM_FAIXAS_GRAU):
+        self.comunidade_por_no = comunidade_por_no
+        self.grafo = grafo
+
+        # comunidade -> lista de nós (ordem crescente, determinística).
+        self.nos_por_comunidade = {}
+        for v, c in enumerate(comunidade_por_no):
+            self.nos_por_comunidade.setdefault(c, []).append(v)
+        self.comunidades = sorted(self.nos_por_comunidade)
+        self.posicao_comunidade = {c: i for i, c in enumerate(self.comunidades)}
+
+        # Limites das faixas de grau pelos quantis (faixas repetidas são unificadas).
+        graus = [grafo.grau(v) for v in range(len(comunidade_por_no))]
+        ordenados = sorted(graus)
+        limites = []
+        for k in range(1, num_faixas):
+            limite = ordenados[k * len(ordenados) // num_faixas] if ordenados else 0
+            if not limites or limite > limites[-1]:
+                limites.append(limite)
+        self.limites_grau = limites
+
+        # faixa de grau de cada nó e nós por faixa.
+        self.faixa_por_no = [bisect_right(limites, grau) for grau in graus]
+        self.nos_por_faixa = [[] for _ in range(len(limites) + 1)]
+        for v, faixa in enumerate(self.faixa_por_no):
+            self.nos_por_faixa[faixa].append(v)
+
+    def faixas(self):
+        # Faixas de grau com ao menos um nó.
+        return [faixa for faixa, nos in enumerate(self.nos_por_faixa) if nos]
+
+    def descrever_faixa(self, faixa):
+        # Ex.: "grau < 12", "12 <= grau < 20", "grau >= 31".
+        limites = self.limites_grau
+        if not limites:
+            return "todos"
+        if faixa == 0:
+            return f"grau < {limites[0]}"
+        if faixa == len(limites):
+            return f"grau >= {limites[-1]}"
+        return f"{limites[faixa - 1]} <= grau < {limites[faixa]}"
+
+
+# Função interna: sorteia um destino para a origem conforme o tipo (None se não houver).
+def _sortear_destino(rnd, indice, origem, tipo):
+    comunidade = indice.comunidade_por_no[origem]
+    if tipo == "intra":
+        nos = indice.nos_por_comunidade[comunidade]
+        if len(nos) < 2:
+            return None
+        destino = nos[rnd.randrange(len(nos))]
+        return destino if destino != origem else None
+
+    if len(indice.comunidades) < 2:
+        return None
+    # Sorteio uniforme entre as demais comunidades (pula a posição da comunidade da origem).
+    posicao = rnd.randrange(len(indice.comunidades) - 1)
+    if posicao >= indice.posicao_comunidade[comunidade]:
+        posicao += 1
+    nos = indice.nos_por_comunidade[indice.comunidades[posicao]]
+    return nos[rnd.randrange(len(nos))]
+
+
+# Fluxo de pares estratificados.
+def gerar_pares(indice, quantidade=None, seed=42, proporcao_intra=0.5, pesos_faixas=None,
+                sem_aresta=True, com_estrato=False):
+    """
+    indice: IndiceComunidades (montado uma vez).
+    quantidade: número de pares (None = fluxo infinito; use islice ou em_lotes).
+    proporcao_intra: fração esperada de pares "intra" (o restante é "inter").
+    pesos_faixas: peso de sorteio de cada faixa de grau da origem (padrão: faixas igualmente
+                  representadas, independentemente de quantos nós cada uma tem).
+    sem_aresta: descarta destinos com aresta direta para a origem.
+    com_estrato: entrega (origem, destino, (tipo, faixa)) em vez de (origem, destino).
+
+    Mesma seed e mesmos parâmetros => mesma sequência de pares.
+    ValueError se os estratos pedidos não admitirem pares (ex.: "inter" com uma comunidade).
+    """
+    rnd = random.Random(seed)
+    faixas = indice.faixas()
+    if pesos_faixas is None:
+        pesos = [1.0] * len(faixas)
+    else:
+        pesos = [pesos_faixas[faixa] for faixa in faixas]
+
+    # Pesos acumulados para sortear a faixa com uma busca binária.
+    acumulados = []
+    total = 0.0
+    for peso in pesos:
+        total += peso
+        acumulados.append(total)
+
+    grafo = indice.grafo
+    gerados = 0
+    descartes = 0
+    while quantidade is None or gerados < quantidade:
+        tipo = "intra" if rnd.random() < proporcao_intra else "inter"
+        faixa = faixas[min(bisect_right(acumulados, rnd.random() * total), len(faixas) - 1)]
+        nos = indice.nos_por_faixa[faixa]
+        origem = nos[rnd.randrange(len(nos))]
+
+        for _ in range(TENTATIVAS_DESTINO):
+            destino = _sortear_destino(rnd, indice, origem, tipo)
+            if destino is None:
+                continue
+            if sem_aresta and grafo.possuiAresta(origem, destino):
+                continue
+            yield (origem, destino, (tipo, faixa)) if com_estrato else (origem, destino)
+            gerados += 1
+            descartes = 0
+            break
+        else:
+            descartes += 1
+            if descartes >= MAX_DESCARTES_SEGUIDOS:
+                raise ValueError("Nenhum par válido para os estratos pedidos.")
+
+
+# Agrupa um fluxo de pares em listas de até tamanho_lote (ex.: para Consultas.consultar_lote).
+def em_lotes(pares, tamanho_lote=10000):
+    pares = iter(pares)
+    while True:
+        lote = list(islice(pares, tamanho_lote))
+        if not lote:
+            return
+        yield lote
@@ -0,0 +1,236 @@
+# -----------------------------------------------------------------------------------------
+# Centralidade.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa a centralidade de intermediação (betweenness) de vértices e arestas.
+
+# Algoritmo de Brandes: para cada fonte s, uma busca (Dijkstra na fricção, BFS nos saltos)
+# conta os caminhos mínimos (sigma) e guarda os predecessores; depois as dependências são
+# acumuladas em ordem reversa de fechamento. Custo O(V * (E + V log V)) no modo exato.
+# Modo amostrado: só "amostras" fontes sorteadas (seed), com o resultado escalado por
+# V / amostras. Limite de erro (Hoeffding + união sobre os V vértices): com probabilidade
+# >= confianca, todo vértice tem erro na centralidade normalizada (0..1) de no máximo
+#     erro = sqrt(ln(2V / (1 - confianca)) / (2 * amostras)) * V / (V - 1)
+# As fontes são distribuídas entre processos (mesma estratégia de Consultas.py: o grafo é
+# herdado via fork, ou enviado uma vez por processo).
+# Grafos não-direcionados: cada par (s, t) é contado nas duas direções, então os valores
+# são divididos por 2. Empates de custo na fricção usam igualdade exata de float.
+
+import math
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heappop
+
+from Algoritmos import INF
+
+# Grafo do processo trabalhador (herdado via fork ou definido na inicialização).
+_GRAFO = None
+
+
+# Função interna: busca de uma fonte (ordem de fechamento, sigma e predecessores).
+def _busca_brandes(grafo, fonte, unitario):
+    total_vertices = grafo.numVertices
+    sigma = [0] * total_vertices
+    predecessores = [None] * total_vertices
+    sigma[fonte] = 1
+    predecessores[fonte] = []
+    ordem = []
+
+    if unitario:
+        distancias = [-1] * total_vertices
+        distancias[fonte] = 0
+        inicio = 0
+        ordem.append(fonte)
+        while inicio < len(ordem):
+            v = ordem[inicio]
+            inicio += 1
+            proxima = distancias[v] + 1
+            for (w, _) in grafo.vizinhos(v):
+                if distancias[w] < 0:
+                    distancias[w] = proxima
+                    ordem.append(w)
+                    predecessores[w] = []
+                if distancias[w] == proxima:
+                    sigma[w] += sigma[v]
+                    predecessores[w].append(v)
+        return ordem, sigma, predecessores
+
+    distancias = [INF] * total_vertices
+    distancias[fonte] = 0
+    fechados = [False] * total_vertices
+    heap = [(0, fonte)]
+    while heap:
+        distancia_atual, v = heappop(heap)
+        if fechados[v]:
+            continue
+        fechados[v] = True
+        ordem.append(v)
+        for (w, peso) in grafo.vizinhos(v):
+            if fechados[w]:
+                continue
+            alternativa = distancia_atual + peso
+            if alternativa < distancias[w]:
+                distancias[w] = alternativa
+                sigma[w] = sigma[v]
+                predecessores[w] = [v]
+                heappush(heap, (alternativa, w))
+            elif alternativa == distancias[w]:
+                # Outro caminho mínimo até w (empate exato).
+                sigma[w] += sigma[v]
+                predecessores[w].append(v)
+    return ordem, sigma, predecessores
+
+
+# Função interna: acumula as dependências de um conjunto de fontes.
+def _acumular_fontes(grafo, fontes):
+    unitario = getattr(grafo, "pesosUnitarios", False)
+    total_vertices = grafo.numVertices
+    vertices = [0.0] * total_vertices
+    arestas = {}
+
+    for fonte in fontes:
+        ordem, sigma, predecessores = _busca_brandes(grafo, fonte, unitario)
+        dependencia = {}
+        for w in reversed(ordem):
+            coeficiente = (1.0 + dependencia.get(w, 0.0)) / sigma[w]
+            for v in predecessores[w]:
+                contribuicao = sigma[v] * coeficiente
+                dependencia[v] = dependencia.get(v, 0.0) + contribuicao
+                chave = (v, w) if v < w else (w, v)
+                arestas[chave] = arestas.get(chave, 0.0) + contribuicao
+            if w != fonte:
+                vertices[w] += dependencia.get(w, 0.0)
+    return vertices, arestas
+
+
+# Inicialização do processo trabalhador quando não há fork.
+def _inicializar_trabalhador(grafo):
+    global _GRAFO
+    _GRAFO = grafo
+
+
+# Tarefa executada no processo trabalhador: um grupo de fontes.
+def _acumular_grupo(fontes):
+    return _acumular_fontes(_GRAFO, fontes)
+
+
+# Amostras necessárias para um erro normalizado máximo com a confiança dada.
+# Inversa de limite_erro (mesma fórmula, com o fator V / (V - 1)); a partir de V, modo exato.
+def amostras_necessarias(num_vertices, erro, confianca=0.95):
+    if num_vertices <= 1:
+        return num_vertices
+    fator = num_vertices / (num_vertices - 1)
+    amostras = math.ceil(math.log(2 * num_vertices / (1 - confianca)) * fator * fator / (2 * erro * erro))
+    return min(amostras, num_vertices)
+
+
+# Limite de erro (centralidade normalizada) de uma estimativa com "amostras" fontes.
+def limite_erro(num_vertices, amostras, confianca=0.95):
+    if amostras >= num_vertices:
+        return 0.0
+    return math.sqrt(math.log(2 * num_vertices / (1 - confianca)) / (2 * amostras)) * num_vertices / (num_vertices - 1)
+
+
+def centralidade_intermediacao(grafo, comunidade_por_no=None, amostras=None, seed=42, confianca=0.95,
+                               processos=None, fontes_por_tarefa=32, top=None, nao_direcionado=True):
+    """
+    grafo: grafo de uma camada (ex.: grafo_friccao ou grafo_saltos).
+    amostras: None = modo exato (todas as fontes); senão, número de fontes sorteadas.
+    processos: quantidade de processos (padrão: os.cpu_count()); 1 executa no próprio processo.
+    top: limita o tamanho dos rankings.
+
+    Retorna dicionário com:
+    - "vertices": [(v, centralidade, centralidade_normalizada, comunidade)] em ordem decrescente
+    - "arestas": [(u, v, centralidade, comunidade_u, comunidade_v, eh_ponte)] em ordem decrescente
+    - "amostras", "exato", "confianca", "erro_normalizado"
+    """
+    global _GRAFO
+
+    total_vertices = grafo.numVertices
+    if amostras is None or amostras >= total_vertices:
+        fontes = list(range(total_vertices))
+        exato = True
+    else:
+        fontes = random.Random(seed).sample(range(total_vertices), amostras)
+        exato = False
+
+    if processos is None:
+        processos = os.cpu_count() or 1
+
+    grupos = [fontes[i:i + fontes_por_tarefa] for i in range(0, len(fontes), fontes_por_tarefa)]
+    if processos <= 1 or len(grupos) <= 1:
+        parciais = [_acumular_fontes(grafo, fontes)]
+    elif "fork" in multiprocessing.get_all_start_methods():
+        # Os trabalhadores herdam _GRAFO já em memória (sem pickle do grafo).
+        _GRAFO = grafo
+        try:
+            with ProcessPoolExecutor(max_workers=processos, mp_context=multiprocessing.get_context("fork")) as executor:
+                parciais = list(executor.map(_acumular_grupo, grupos))
+        finally:
+            _GRAFO = None
+    else:
+        with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_trabalhador,
+                                 initargs=(grafo,)) as executor:
+            parciais = list(executor.map(_acumular_grupo, grupos))
+
+    # Soma as parciais e aplica a escala (amostragem e contagem dupla em não-direcionados).
+    escala = total_vertices / len(fontes) if fontes else 0.0
+    if nao_direcionado:
+        escala /= 2
+    vertices = [0.0] * total_vertices
+    arestas = {}
+    for parcial_vertices, parcial_arestas in parciais:
+        for v, valor in enumerate(parcial_vertices):
+            vertices[v] += valor
+        for chave, valor in parcial_arestas.items():
+            arestas[chave] = arestas.get(chave, 0.0) + valor
+
+    pares = (total_vertices - 1) * (total_vertices - 2)
+    if nao_direcionado:
+        pares /= 2
+    comunidade = comunidade_por_no if comunidade_por_no is not None else [None] * total_vertices
+
+    ranking_vertices = sorted(
+        (
+            (v, valor * escala, valor * escala / pares if pares else 0.0, comunidade[v])
+            for v, valor in enumerate(vertices)
+        ),
+        key=lambda item: item[1], reverse=True,
+    )
+    ranking_arestas = sorted(
+        (
+            (u, v, valor * escala, comunidade[u], comunidade[v],
+             comunidade_por_no is not None and comunidade[u] != comunidade[v])
+            for (u, v), valor in arestas.items()
+        ),
+        key=lambda item: item[2], reverse=True,
+    )
+
+    return {
+        "vertices": ranking_vertices[:top] if top is not None else ranking_vertices,
+        "arestas": ranking_arestas[:top] if top is not None else ranking_arestas,
+        "amostras": len(fontes),
+        "exato": exato,
+        "confianca": confianca,
+        "erro_normalizado": 0.0 if exato else limite_erro(total_vertices, len(fontes), confianca),
+    }
+
+
+# Mesma análise nas camadas de fricção e de saltos.
+def centralidade_camadas(grafos, comunidade_por_no, camadas=("friccao", "saltos"), **opcoes):
+    """
+    grafos: grafo com camadas (GrafoCamadas/GrafoMapeado) ou dicionário nome->grafo.
+    opcoes: repassadas para centralidade_intermediacao (amostras, processos, top, ...).
+    Retorna {camada: resultado}.
+    """
+    resultado = {}
+    for nome in camadas:
+        grafo = grafos.camada(nome) if hasattr(grafos, "camada") else grafos[nome]
+        resultado[nome] = centralidade_intermediacao(grafo, comunidade_por_no, **opcoes)
+    return resultado
@@ -0,0 +1,143 @@
+# -----------------------------------------------------------------------------------------
+# Consultas.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa a consulta em lote de pares (origem, destino).
+
+# Estratégia:
+# - agrupa os pares por origem: cada árvore de caminhos mínimos é calculada uma única vez
+#   por camada, e todos os destinos daquela origem são respondidos a partir dela
+# - distribui as origens entre processos (concurrent.futures)
+# - o grafo NÃO é enviado a cada tarefa: com "fork" os processos herdam o grafo já em memória;
+#   sem fork, cada processo recebe o grafo uma única vez na inicialização, ou abre o mesmo
+#   arquivo binário (Persistencia.py) via mmap, compartilhando as páginas.
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from Algoritmos import caminhos_minimos, reconstruir_caminho_prev
+from Persistencia import carregar_grafo
+
+# Camadas consultadas por padrão (baseline e fricção).
+CAMADAS_PADRAO = ("saltos", "friccao")
+
+# Grafos do processo trabalhador (herdados via fork ou definidos na inicialização).
+_GRAFOS = None
+
+
+# Função interna que normaliza a entrada em um dicionário nome->grafo.
+def _abrir_grafos(grafos, camadas):
+    # Caminho de arquivo binário: abre via mmap.
+    if isinstance(grafos, str):
+        grafos = carregar_grafo(grafos)
+
+    # Grafo com camadas (GrafoCamadas ou GrafoMapeado).
+    if hasattr(grafos, "camada"):
+        return {nome: grafos.camada(nome) for nome in camadas}
+
+    return {nome: grafos[nome] for nome in camadas}
+
+
+# Inicialização do processo trabalhador quando não há fork (grafo recebido uma vez só).
+def _inicializar_trabalhador(grafos, camadas):
+    global _GRAFOS
+    _GRAFOS = _abrir_grafos(grafos, camadas)
+
+
+# Responde todos os destinos de uma origem, em todas as camadas.
+def _consultar_origem(grafos, origem, destinos):
+    respostas = {destino: {} for destino in destinos}
+    for nome, grafo in grafos.items():
+        # Uma única árvore de caminhos mínimos por (origem, camada).
+        distancias, predecessor = caminhos_minimos(grafo, origem)
+        for destino in destinos:
+            caminho = reconstruir_caminho_prev(predecessor, origem, destino)
+            hops = len(caminho) - 1 if caminho else None
+            respostas[destino][nome] = (distancias[destino], hops, caminho)
+    return origem, respostas
+
+
+# Tarefa executada no processo trabalhador: um grupo de origens.
+def _consultar_grupo(grupo):
+    return [_consultar_origem(_GRAFOS, origem, destinos) for origem, destinos in grupo]
+
+
+# Agrupa os pares por origem, preservando a ordem de primeira ocorrência.
+def agrupar_por_origem(pares):
+    destinos_por_origem = {}
+    for origem, destino in pares:
+        destinos_por_origem.setdefault(origem, []).append(destino)
+    return destinos_por_origem
+
+
+# API pública: consulta um lote de pares (origem, destino).
+def consultar_lote(grafos, pares, camadas=CAMADAS_PADRAO, processos=None, origens_por_tarefa=8):
+    """
+    grafos: dicionário nome->grafo (ex.: {"saltos": grafo_saltos, "friccao": grafo_friccao}),
+            um grafo com camadas (GrafoCamadas/GrafoMapeado) ou o caminho de um arquivo
+            gravado por Persistencia.salvar_grafo (aberto e fechado dentro da chamada).
+    pares: iterável de (origem, destino).
+    processos: quantidade de processos (padrão: os.cpu_count()); 1 executa no próprio processo.
+
+    Retorna dicionário {(origem, destino): {camada: (custo, hops, caminho)}}.
+    """
+    global _GRAFOS
+
+    destinos_por_origem = agrupar_por_origem(pares)
+    itens = list(destinos_por_origem.items())
+
+    if processos is None:
+        processos = os.cpu_count() or 1
+
+    sequencial = processos <= 1 or len(itens) <= 1
+    com_fork = "fork" in multiprocessing.get_all_start_methods()
+
+    # Arquivo aberto aqui (execução sequencial ou com fork) é fechado ao final do lote.
+    # Sem fork, cada trabalhador abre o seu mapeamento, liberado quando o processo termina.
+    mapeado = None
+    if isinstance(grafos, str) and (sequencial or com_fork):
+        mapeado = grafos = carregar_grafo(grafos)
+
+    resultados = []
+    try:
+        if sequencial:
+            # Execução sequencial no próprio processo.
+            grafos_locais = _abrir_grafos(grafos, camadas)
+            resultados = [_consultar_origem(grafos_locais, origem, destinos) for origem, destinos in itens]
+        else:
+            # Tarefas com várias origens reduzem o overhead de comunicação entre processos.
+            grupos = [itens[i:i + origens_por_tarefa] for i in range(0, len(itens), origens_por_tarefa)]
+
+            if com_fork:
+                # Os trabalhadores herdam _GRAFOS já montado (sem pickle do grafo).
+                _GRAFOS = _abrir_grafos(grafos, camadas)
+                executor = ProcessPoolExecutor(
+                    max_workers=processos, mp_context=multiprocessing.get_context("fork")
+                )
+            else:
+                # Sem fork: cada trabalhador recebe o grafo (ou o caminho do arquivo) uma única vez.
+                executor = ProcessPoolExecutor(
+                    max_workers=processos, initializer=_inicializar_trabalhador, initargs=(grafos, camadas)
+                )
+
+            try:
+                with executor:
+                    for parcial in executor.map(_consultar_grupo, grupos):
+                        resultados.extend(parcial)
+            finally:
+                _GRAFOS = None
+    finally:
+        if mapeado is not None:
+            mapeado.fechar()
+
+    # Monta o dicionário final indexado por par.
+    respostas = {}
+    for origem, por_destino in resultados:
+        for destino, por_camada in por_destino.items():
+            respostas[(origem, destino)] = por_camada
+    return respostas
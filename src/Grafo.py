@@ -4,12 +4,22 @@
 # Implementação baseada no material da disciplina
 # --------------------------------------------------------------------
 
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from sys import getsizeof
+
+
 class MatrizAdjacencias:
     def __init__(self, numVertices):
         self.numVertices = numVertices
         self.numArestas = 0
         self.grauVertice = [0] * numVertices
         self.matriz = [[0] * numVertices for _ in range(numVertices)]
+        # Permanece True enquanto todas as arestas tiverem peso 1 (permite usar BFS).
+        self.pesosUnitarios = True
+        # Contador de alterações (invalida caches de caminhos mínimos).
+        self.versao = 0
 
     def ordem(self):
         return self.numVertices
@@ -22,10 +32,13 @@ class MatrizAdjacencias:
         return self.numArestas / maxArestas
 
     def addAresta(self, v1, v2, peso=1):
+        self.versao += 1
         if self.matriz[v1][v2] == 0:
             self.numArestas += 1
             self.grauVertice[v1] += 1
         self.matriz[v1][v2] = peso
+        if peso != 1:
+            self.pesosUnitarios = False
 
     def possuiAresta(self, v1, v2):
         return self.matriz[v1][v2] != 0
@@ -43,10 +56,17 @@ class MatrizAdjacencias:
 
 class ListaAdjacencias:
     # Estrutura mais eficiente para grafos esparsos
-    def __init__(self, numVertices):
+    def __init__(self, numVertices, indexado=False):
         self.numVertices = numVertices
         self.numArestas = 0
         self.lista = [[] for _ in range(numVertices)]
+        # Índice opcional: vizinhos ordenados por vértice em array('i') (possuiAresta O(log d)
+        # por busca binária, rejeita duplicatas), bem mais compacto que um set de tuplas.
+        self.indice = [array("i") for _ in range(numVertices)] if indexado else None
+        # Permanece True enquanto todas as arestas tiverem peso 1 (permite usar BFS).
+        self.pesosUnitarios = True
+        # Contador de alterações (invalida caches de caminhos mínimos).
+        self.versao = 0
 
     def ordem(self):
         return self.numVertices
@@ -59,10 +79,29 @@ class ListaAdjacencias:
         return self.numArestas / maxArestas
 
     def addAresta(self, v1, v2, peso=1):
+        # Com índice, aresta repetida é rejeitada (retorna False).
+        if self.indice is not None:
+            vizinhos = self.indice[v1]
+            i = bisect_left(vizinhos, v2)
+            if i < len(vizinhos) and vizinhos[i] == v2:
+                return False
+            vizinhos.insert(i, v2)
+        self.versao += 1
         self.lista[v1].append((v2, peso))
         self.numArestas += 1
+        if peso != 1:
+            self.pesosUnitarios = False
+        return True
+
+    def _indexada(self, v1, v2):
+        # Posição de v2 no índice ordenado de v1 (-1 se não houver a aresta).
+        vizinhos = self.indice[v1]
+        i = bisect_left(vizinhos, v2)
+        return i if i < len(vizinhos) and vizinhos[i] == v2 else -1
 
     def possuiAresta(self, v1, v2):
+        if self.indice is not None:
+            return self._indexada(v1, v2) >= 0
         return any(vertice == v2 for vertice, _ in self.lista[v1])
 
     def vizinhos(self, v):
@@ -71,6 +110,245 @@ class ListaAdjacencias:
     def grau(self, v):
         return len(self.lista[v])
 
+    def memoriaBytes(self):
+        # Estimativa: listas por vértice + uma tupla (v2, peso) por aresta (+ índice, se houver).
+        total = getsizeof(self.lista)
+        for arestas in self.lista:
+            total += getsizeof(arestas) + sum(getsizeof(aresta) for aresta in arestas)
+        if self.indice is not None:
+            total += getsizeof(self.indice) + sum(getsizeof(vizinhos) for vizinhos in self.indice)
+        return total
+
     def printGrafo(self):
         for i in range(self.numVertices):
             print(f"Vertice {i}:", self.lista[i])
+
+
+class GrafoCSR:
+    # Representação compacta e imutável (Compressed Sparse Row) construída a partir de
+    # uma ListaAdjacencias ou MatrizAdjacencias já pronta.
+    # - offsets[v] .. offsets[v+1]: faixa das arestas de v
+    # - destinos[i], pesos[i]: vértice e peso da i-ésima aresta (ordenadas por destino)
+    # Os vetores são array (tipados, contíguos), sem uma tupla Python por aresta.
+    # Em grafos de pesos unitários o vetor de pesos não é guardado (pesos = None).
+    def __init__(self, grafo):
+        numVertices = grafo.ordem()
+        pesosUnitarios = getattr(grafo, "pesosUnitarios", False)
+        offsets = array("q", [0]) * (numVertices + 1)
+        destinos = array("i")
+        pesos = None if pesosUnitarios else array("d")
+        for v in range(numVertices):
+            for (v2, peso) in sorted(grafo.vizinhos(v)):
+                destinos.append(v2)
+                if pesos is not None:
+                    pesos.append(peso)
+            offsets[v + 1] = len(destinos)
+
+        self._definirVetores(offsets, destinos, pesos)
+
+    @classmethod
+    def deVetores(cls, offsets, destinos, pesos=None):
+        # Monta o grafo direto de vetores já prontos (array, memoryview de mmap, ...),
+        # sem copiá-los. pesos=None indica peso 1 em todas as arestas.
+        grafo = cls.__new__(cls)
+        grafo._definirVetores(offsets, destinos, pesos)
+        return grafo
+
+    def _definirVetores(self, offsets, destinos, pesos):
+        object.__setattr__(self, "numVertices", len(offsets) - 1)
+        object.__setattr__(self, "numArestas", len(destinos))
+        object.__setattr__(self, "offsets", offsets)
+        object.__setattr__(self, "destinos", destinos)
+        object.__setattr__(self, "pesos", pesos)
+        object.__setattr__(self, "pesosUnitarios", pesos is None)
+        # Imutável: a versão nunca muda.
+        object.__setattr__(self, "versao", 0)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("GrafoCSR é imutável")
+
+    def ordem(self):
+        return self.numVertices
+
+    def tamanho(self):
+        return self.numArestas
+
+    def densidade(self):
+        maxArestas = self.numVertices * (self.numVertices - 1)
+        return self.numArestas / maxArestas
+
+    def possuiAresta(self, v1, v2):
+        # Destinos de cada vértice estão ordenados: busca binária O(log grau).
+        inicio = self.offsets[v1]
+        fim = self.offsets[v1 + 1]
+        i = bisect_left(self.destinos, v2, inicio, fim)
+        return i < fim and self.destinos[i] == v2
+
+    def vizinhos(self, v):
+        inicio = self.offsets[v]
+        fim = self.offsets[v + 1]
+        if self.pesos is None:
+            return zip(self.destinos[inicio:fim], repeat(1, fim - inicio))
+        return zip(self.destinos[inicio:fim], self.pesos[inicio:fim])
+
+    def grau(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def memoriaBytes(self):
+        # Bytes ocupados pelos vetores (dados contíguos, sem overhead por aresta).
+        vetores = (self.offsets, self.destinos) if self.pesos is None else (self.offsets, self.destinos, self.pesos)
+        return sum(vetor.itemsize * len(vetor) for vetor in vetores)
+
+    def printGrafo(self):
+        for i in range(self.numVertices):
+            print(f"Vertice {i}:", list(self.vizinhos(i)))
+
+
+class GrafoCamadas:
+    # Topologia armazenada uma única vez, com várias camadas de peso nomeadas
+    # (ex.: "saltos", "friccao", "interacao"). Cada camada é acessada por uma visão
+    # (CamadaGrafo) que reaproveita a mesma lista de vizinhos, sem copiar o grafo.
+    def __init__(self, numVertices, nomesCamadas, indexado=False):
+        self.numVertices = numVertices
+        self.numArestas = 0
+        self.lista = [[] for _ in range(numVertices)]
+        # Índice opcional: vizinhos ordenados por vértice em array('i') (possuiAresta O(log d)
+        # por busca binária, rejeita duplicatas), bem mais compacto que um set de tuplas.
+        self.indice = [array("i") for _ in range(numVertices)] if indexado else None
+        # pesos[nome][v][i] = peso da i-ésima aresta de v na camada "nome"
+        self.pesos = {nome: [[] for _ in range(numVertices)] for nome in nomesCamadas}
+        self.pesosUnitarios = {nome: True for nome in nomesCamadas}
+        self.visoes = {}
+        # Contador de alterações (invalida caches de caminhos mínimos).
+        self.versao = 0
+
+    def ordem(self):
+        return self.numVertices
+
+    def tamanho(self):
+        return self.numArestas
+
+    def densidade(self):
+        maxArestas = self.numVertices * (self.numVertices - 1)
+        return self.numArestas / maxArestas
+
+    def addAresta(self, v1, v2, **pesos):
+        # Com índice, aresta repetida é rejeitada (retorna False).
+        if self.indice is not None:
+            vizinhos = self.indice[v1]
+            i = bisect_left(vizinhos, v2)
+            if i < len(vizinhos) and vizinhos[i] == v2:
+                return False
+            vizinhos.insert(i, v2)
+        self.versao += 1
+        # Exige um peso para cada camada (KeyError se faltar alguma).
+        for nome, camada in self.pesos.items():
+            peso = pesos[nome]
+            camada[v1].append(peso)
+            if peso != 1:
+                self.pesosUnitarios[nome] = False
+        self.lista[v1].append(v2)
+        self.numArestas += 1
+        return True
+
+    def alterarAresta(self, v1, v2, **pesos):
+        # Altera os pesos (apenas das camadas informadas) da aresta v1->v2 já existente.
+        i = self.lista[v1].index(v2)
+        self.versao += 1
+        for nome, peso in pesos.items():
+            self.pesos[nome][v1][i] = peso
+            if peso != 1:
+                self.pesosUnitarios[nome] = False
+
+    def removerAresta(self, v1, v2):
+        # Remove a aresta v1->v2 (ValueError se não existir).
+        i = self.lista[v1].index(v2)
+        self.versao += 1
+        del self.lista[v1][i]
+        for camada in self.pesos.values():
+            del camada[v1][i]
+        self.numArestas -= 1
+        if self.indice is not None:
+            del self.indice[v1][self._indexada(v1, v2)]
+
+    def _indexada(self, v1, v2):
+        # Posição de v2 no índice ordenado de v1 (-1 se não houver a aresta).
+        vizinhos = self.indice[v1]
+        i = bisect_left(vizinhos, v2)
+        return i if i < len(vizinhos) and vizinhos[i] == v2 else -1
+
+    def possuiAresta(self, v1, v2):
+        if self.indice is not None:
+            return self._indexada(v1, v2) >= 0
+        return v2 in self.lista[v1]
+
+    def grau(self, v):
+        return len(self.lista[v])
+
+    def camadas(self):
+        return list(self.pesos)
+
+    def camada(self, nome):
+        # Visão da camada (criada uma vez e reutilizada).
+        if nome not in self.pesos:
+            raise KeyError(f"Camada inexistente: {nome}")
+        if nome not in self.visoes:
+            self.visoes[nome] = CamadaGrafo(self, nome)
+        return self.visoes[nome]
+
+    def memoriaBytes(self):
+        # Estimativa: listas de vizinhos (compartilhadas) + listas de pesos por camada.
+        total = getsizeof(self.lista) + sum(getsizeof(vizinhos) for vizinhos in self.lista)
+        for camada in self.pesos.values():
+            total += getsizeof(camada) + sum(getsizeof(pesos) for pesos in camada)
+        if self.indice is not None:
+            total += getsizeof(self.indice) + sum(getsizeof(vizinhos) for vizinhos in self.indice)
+        return total
+
+    def printGrafo(self):
+        for i in range(self.numVertices):
+            print(f"Vertice {i}:", self.lista[i], {nome: camada[i] for nome, camada in self.pesos.items()})
+
+
+class CamadaGrafo:
+    # Visão de uma camada de GrafoCamadas com a mesma API de ListaAdjacencias
+    # (numVertices, vizinhos, grau, ...), para que os motores rodem sem alteração.
+    def __init__(self, grafo, nome):
+        self.grafo = grafo
+        self.nome = nome
+        self.numVertices = grafo.numVertices
+        self.pesos = grafo.pesos[nome]
+
+    @property
+    def numArestas(self):
+        return self.grafo.numArestas
+
+    @property
+    def pesosUnitarios(self):
+        return self.grafo.pesosUnitarios[self.nome]
+
+    @property
+    def versao(self):
+        return self.grafo.versao
+
+    def ordem(self):
+        return self.grafo.ordem()
+
+    def tamanho(self):
+        return self.grafo.tamanho()
+
+    def densidade(self):
+        return self.grafo.densidade()
+
+    def possuiAresta(self, v1, v2):
+        return self.grafo.possuiAresta(v1, v2)
+
+    def vizinhos(self, v):
+        return zip(self.grafo.lista[v], self.pesos[v])
+
+    def grau(self, v):
+        return self.grafo.grau(v)
+
+    def printGrafo(self):
+        for i in range(self.numVertices):
+            print(f"Vertice {i}:", list(self.vizinhos(i)))
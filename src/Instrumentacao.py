@@ -0,0 +1,97 @@
+# -----------------------------------------------------------------------------------------
+# Instrumentacao.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa contadores e tempos por fase para investigar consultas lentas.
+
+# Instrumentação opcional (opt-in):
+# - dijkstra_heap, bfs e caminhos_minimos (Algoritmos.py) aceitam metricas=None: com um
+#   Metricas, contam vértices fechados, relaxações, diminuições, push/pop no heap e o maior
+#   tamanho da fronteira; sem ele, nada é contado (um único desvio por evento)
+# - consulta_instrumentada mede as fases "busca" e "reconstrucao" e chama um callback
+#   opcional por consulta (ex.: exportar para monitoramento)
+
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+from Algoritmos import caminhos_minimos, reconstruir_caminho_prev
+
+
+# Contadores de uma ou mais consultas (somados quando o mesmo objeto é reutilizado).
+class Metricas:
+    def __init__(self):
+        self.consultas = 0
+        self.assentados = 0
+        self.relaxacoes = 0
+        self.diminuicoes = 0
+        self.pushes = 0
+        self.pops = 0
+        self.max_fronteira = 0
+
+        # fase -> tempo acumulado em nanossegundos (ex.: "geracao", "busca", "reconstrucao").
+        self.tempos_ns = {}
+
+    @contextmanager
+    def fase(self, nome):
+        # Uso: with metricas.fase("busca"): ...
+        inicio = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.tempos_ns[nome] = self.tempos_ns.get(nome, 0) + perf_counter_ns() - inicio
+
+    def somar(self, outra):
+        self.consultas += outra.consultas
+        self.assentados += outra.assentados
+        self.relaxacoes += outra.relaxacoes
+        self.diminuicoes += outra.diminuicoes
+        self.pushes += outra.pushes
+        self.pops += outra.pops
+        self.max_fronteira = max(self.max_fronteira, outra.max_fronteira)
+        for nome, tempo in outra.tempos_ns.items():
+            self.tempos_ns[nome] = self.tempos_ns.get(nome, 0) + tempo
+
+    def como_dict(self):
+        resultado = {
+            "consultas": self.consultas,
+            "assentados": self.assentados,
+            "relaxacoes": self.relaxacoes,
+            "diminuicoes": self.diminuicoes,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "max_fronteira": self.max_fronteira,
+        }
+        for nome, tempo in self.tempos_ns.items():
+            resultado["tempo_" + nome + "_ns"] = tempo
+        return resultado
+
+
+# -----------------------------------------------------------------------------------------
+# Consulta ponto a ponto com fases medidas e callback
+# -----------------------------------------------------------------------------------------
+def consulta_instrumentada(grafo, origem, destino, metricas=None, callback=None, motor=caminhos_minimos):
+    """
+    Roda busca + reconstrução do caminho e retorna (custo, caminho, metricas_da_consulta).
+
+    motor: motor que aceita metricas (assinatura (grafo, origem, destino, metricas)).
+
+    metricas: se informado, acumula também os contadores desta consulta (ex.: um lote).
+    callback: se informado, é chamado com (origem, destino, metricas_da_consulta.como_dict()).
+    """
+    consulta = Metricas()
+    consulta.consultas = 1
+
+    with consulta.fase("busca"):
+        distancias, predecessor = motor(grafo, origem, destino, consulta)
+    with consulta.fase("reconstrucao"):
+        caminho = reconstruir_caminho_prev(predecessor, origem, destino)
+
+    if metricas is not None:
+        metricas.somar(consulta)
+    if callback is not None:
+        callback(origem, destino, consulta.como_dict())
+    return distancias[destino], caminho, consulta
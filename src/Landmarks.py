@@ -0,0 +1,177 @@
+# -----------------------------------------------------------------------------------------
+# Landmarks.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa a busca ALT (A* + Landmarks + desigualdade triangular).
+
+# Pré-processamento:
+# - escolhe alguns vértices "marco" (landmarks), de preferência na periferia das comunidades
+# - guarda a distância de cada landmark para todos os vértices (tabelas compactas em array)
+# Consulta:
+# - A* guiado pela heurística h(v) = max |d(L, t) - d(L, v)|, que nunca superestima
+#   o custo restante (desigualdade triangular), então o caminho continua ótimo.
+# Vale para grafos não-direcionados (como os de gerar_rede_social), onde d(L, v) = d(v, L).
+
+from array import array
+from heapq import heappush, heappop
+
+from Algoritmos import INF, dijkstra_heap
+
+
+# Estrutura que guarda os landmarks e suas tabelas de distância (reutilizável entre consultas).
+class IndiceALT:
+    def __init__(self, landmarks, tabelas):
+        # Lista de vértices escolhidos como landmarks.
+        self.landmarks = landmarks
+
+        # tabelas[i][v] = distância do landmark i até v (array('d'), 8 bytes por entrada).
+        self.tabelas = tabelas
+
+    def heuristica(self, v, destino):
+        # Limite inferior de d(v, destino) pela desigualdade triangular.
+        melhor = 0.0
+        for tabela in self.tabelas:
+            d_destino = tabela[destino]
+            d_v = tabela[v]
+
+            # Landmark não alcança nenhum dos dois: não traz informação.
+            if d_destino == INF and d_v == INF:
+                continue
+
+            # Só um dos dois é alcançável: v e destino estão em componentes diferentes.
+            if d_destino == INF or d_v == INF:
+                return INF
+
+            diferenca = d_destino - d_v if d_destino > d_v else d_v - d_destino
+            if diferenca > melhor:
+                melhor = diferenca
+        return melhor
+
+    def memoria_bytes(self):
+        # Memória ocupada pelas tabelas (sem o overhead dos objetos Python).
+        return sum(tabela.itemsize * len(tabela) for tabela in self.tabelas)
+
+
+# Escolhe o vértice mais distante (entre os candidatos) do conjunto de landmarks já escolhidos.
+def _mais_distante(candidatos, tabelas):
+    melhor_vertice = None
+    melhor_distancia = -1.0
+    for v in candidatos:
+        # Distância de v ao landmark mais próximo (ignora vértices inalcançáveis).
+        distancia = min(tabela[v] for tabela in tabelas)
+        if distancia != INF and distancia > melhor_distancia:
+            melhor_distancia = distancia
+            melhor_vertice = v
+    return melhor_vertice
+
+
+# Seleciona landmarks pelo critério "mais distante" (farthest), opcionalmente por comunidade.
+def selecionar_landmarks(grafo, quantidade, comunidade_por_no=None, inicial=0):
+    """
+    Retorna (landmarks, tabelas).
+
+    Sem comunidade_por_no: escolhe iterativamente o vértice mais distante dos
+    landmarks já escolhidos (começando pelo mais distante de `inicial`).
+
+    Com comunidade_por_no: distribui os landmarks entre as comunidades em rodízio,
+    escolhendo em cada uma o vértice mais periférico (mais distante dos landmarks atuais).
+    """
+    total_vertices = grafo.numVertices
+
+    # Grupos de candidatos: um por comunidade, ou um único grupo com todos os vértices.
+    if comunidade_por_no is None:
+        grupos = [list(range(total_vertices))]
+    else:
+        num_comunidades = max(comunidade_por_no) + 1
+        grupos = [[] for _ in range(num_comunidades)]
+        for no, c in enumerate(comunidade_por_no):
+            grupos[c].append(no)
+        grupos = [g for g in grupos if g]
+
+    # Tabela temporária a partir do vértice inicial (só para achar o primeiro periférico).
+    distancias_iniciais, _ = dijkstra_heap(grafo, inicial)
+    referencia = [array("d", distancias_iniciais)]
+
+    landmarks = []
+    tabelas = []
+    while len(landmarks) < quantidade:
+        grupo = grupos[len(landmarks) % len(grupos)]
+        candidatos = [v for v in grupo if v not in landmarks]
+
+        # Enquanto não houver landmark, usa a distância ao vértice inicial como referência.
+        landmark = _mais_distante(candidatos, tabelas if tabelas else referencia)
+        if landmark is None:
+            # Nenhum candidato alcançável no grupo: pega o primeiro disponível.
+            if not candidatos:
+                break
+            landmark = candidatos[0]
+
+        distancias, _ = dijkstra_heap(grafo, landmark)
+        landmarks.append(landmark)
+        tabelas.append(array("d", distancias))
+
+    return landmarks, tabelas
+
+
+# Pré-processamento completo: seleciona landmarks e monta o índice.
+def preprocessar_alt(grafo, quantidade=8, comunidade_por_no=None, landmarks=None):
+    # Se os landmarks forem informados, apenas calcula as tabelas.
+    if landmarks is not None:
+        tabelas = [array("d", dijkstra_heap(grafo, l)[0]) for l in landmarks]
+        return IndiceALT(list(landmarks), tabelas)
+
+    landmarks, tabelas = selecionar_landmarks(grafo, quantidade, comunidade_por_no)
+    return IndiceALT(landmarks, tabelas)
+
+
+# Consulta A* guiada pelos landmarks.
+def astar_alt(grafo, indice, origem, destino):
+    """
+    Retorna (custo, predecessor), com predecessor compatível com
+    reconstruir_caminho_prev(predecessor, origem, destino).
+    O custo é INF se o destino não for alcançável.
+    """
+    total_vertices = grafo.numVertices
+    distancias = [INF] * total_vertices
+    predecessor = [None] * total_vertices
+    distancias[origem] = 0
+    predecessor[origem] = origem
+    fechados = [False] * total_vertices
+
+    # Heurística calculada uma única vez por vértice (cache da consulta).
+    estimativas = {}
+
+    h_origem = indice.heuristica(origem, destino)
+    if h_origem == INF:
+        return INF, predecessor
+
+    heap = [(h_origem, 0, origem)]
+    while heap:
+        _, distancia_atual, vertice_atual = heappop(heap)
+        if fechados[vertice_atual]:
+            continue
+        fechados[vertice_atual] = True
+
+        if vertice_atual == destino:
+            return distancia_atual, predecessor
+
+        for (vizinho, peso) in grafo.vizinhos(vertice_atual):
+            if fechados[vizinho]:
+                continue
+            distancia_alternativa = distancia_atual + peso
+            if distancias[vizinho] > distancia_alternativa:
+                h = estimativas.get(vizinho)
+                if h is None:
+                    h = indice.heuristica(vizinho, destino)
+                    estimativas[vizinho] = h
+                if h == INF:
+                    continue
+                distancias[vizinho] = distancia_alternativa
+                predecessor[vizinho] = vertice_atual
+                heappush(heap, (distancia_alternativa + h, distancia_alternativa, vizinho))
+
+    return INF, predecessor
@@ -6,8 +6,9 @@
 # https://github.com/luccas00/TP2_AEDs_III
 # 
 # -----------------------------------------------------------------------------------------
-from Algoritmos import dijkstra, reconstruir_caminho_prev
-from RedeSocial import gerar_rede_social
+from Algoritmos import caminhos_minimos, reconstruir_caminho_prev
+from MultiCriterio import fronteira_pareto
+from RedeSocial import gerar_rede_social_camadas
 
 
 # Função utilitária para imprimir o relatório comparando Baseline (saltos) vs Fricção para um par origem/destino.
@@ -47,6 +48,17 @@ def _relatorio_par(nome, origem, destino, distancias_saltos, prev_saltos, distan
         print("Sem Divergência Relevante: caminhos iguais ou indisponíveis (pode acontecer dependendo do grafo/par).")
 
 
+# Função utilitária para imprimir a fronteira de Pareto (hops x custo) entre as duas pontas do relatório.
+def _relatorio_pareto(grafo_friccao, origem, destino):
+    # Uma única busca bi-critério devolve todos os caminhos não-dominados (do menor hops ao menor custo).
+    fronteira = fronteira_pareto(grafo_friccao, origem, destino)
+
+    print("-" * 92)
+    print("Fronteira De Pareto (Hops x Custo De Repasse)")
+    for hops, custo, caminho in fronteira:
+        print(f"Hops={hops} | CustoTotal={custo:.6f} | Caminho={caminho}")
+
+
 # Seleciona um par (origem, destino) dentro da mesma comunidade, priorizando nós “distantes” no bloco.
 def _primeiro_par_mesma_comunidade(comunidade_por_no, alvo_comunidade=0):
     # Filtra todos os nós que pertencem à comunidade alvo (ex.: comunidade 0).
@@ -143,11 +155,11 @@ def main():
     # Parâmetro que controla o impacto da fricção no peso das arestas.
     friccao_alpha = 30.0
 
-    # Gera os dois grafos:
-    # - grafo_friccao: pesos calculados por fricção (custo de repasse)
-    # - grafo_saltos: pesos fixos 1 (minimiza hops)
+    # Gera a rede em um único grafo com camadas de peso:
+    # - camada "friccao": pesos calculados por fricção (custo de repasse)
+    # - camada "saltos": pesos fixos 1 (minimiza hops)
     # - comunidade_por_no: mapeamento nó -> comunidade
-    grafo_friccao, grafo_saltos, comunidade_por_no = gerar_rede_social(
+    grafo, comunidade_por_no = gerar_rede_social_camadas(
         num_vertices=num_vertices,                 # Tamanho da rede
         num_comunidades=num_comunidades,           # Número de comunidades
         p_intra=p_intra,                           # Densidade intra
@@ -161,6 +173,10 @@ def main():
         friccao_alpha=friccao_alpha               # Intensidade da fricção
     )
 
+    # Visões das camadas sobre a mesma topologia (sem cópia do grafo).
+    grafo_friccao = grafo.camada("friccao")
+    grafo_saltos = grafo.camada("saltos")
+
     # -----------------------------------------------------------------
     # Cenários
     # -----------------------------------------------------------------
@@ -171,17 +187,19 @@ def main():
     # Caso 2 (comunidades diferentes). Seleciona um par sem aresta direta para evitar hop=1.
     origem2, destino2 = _par_comunidades_diferentes_sem_aresta(grafo_saltos, comunidade_por_no, c1=0, c2=1)
 
-    # Executa Dijkstra no grafo de saltos e fricção para o Cenário 1 (baseline).
-    dist_s1, prev_s1 = dijkstra(grafo_saltos, origem1)
-    dist_f1, prev_f1 = dijkstra(grafo_friccao, origem1)
+    # Executa o motor de caminhos mínimos no grafo de saltos (BFS, pesos unitários) e fricção (Dijkstra) para o Cenário 1.
+    dist_s1, prev_s1 = caminhos_minimos(grafo_saltos, origem1)
+    dist_f1, prev_f1 = caminhos_minimos(grafo_friccao, origem1)
 
     _relatorio_par("CASO 1 — Mesma Comunidade", origem1, destino1, dist_s1, prev_s1, dist_f1, prev_f1)
+    _relatorio_pareto(grafo_friccao, origem1, destino1)
 
-    # Executa Dijkstra no grafo de saltos e fricção para o Cenário 2
-    dist_s2, prev_s2 = dijkstra(grafo_saltos, origem2)
-    dist_f2, prev_f2 = dijkstra(grafo_friccao, origem2)
+    # Executa o motor de caminhos mínimos no grafo de saltos e fricção para o Cenário 2
+    dist_s2, prev_s2 = caminhos_minimos(grafo_saltos, origem2)
+    dist_f2, prev_f2 = caminhos_minimos(grafo_friccao, origem2)
 
     _relatorio_par("CASO 2 — Comunidades Diferentes", origem2, destino2, dist_s2, prev_s2, dist_f2, prev_f2)
+    _relatorio_pareto(grafo_friccao, origem2, destino2)
 
 
 if __name__ == "__main__":
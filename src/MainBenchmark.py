@@ -2,267 +2,405 @@
 # MainBenchmark.py
 #
 # Link para Repositorio do Projeto no GitHub
-# 
+#
 # https://github.com/luccas00/TP2_AEDs_III
-# 
+#
 # -----------------------------------------------------------------------------------------
-# Este arquivo roda benchmark com múltiplas rodadas e escreve o log em arquivo.
+# Este arquivo roda a suíte de benchmark de escala e grava os resultados em JSON/CSV.
 
 # Benchmark do experimento "Caminho Mais Eficiente Para Viralização".
-# Objetivo é medir tempo, custo e hops médios por cenário e por modelo.
-
+# Para cada cenário (tamanho x densidade x comunidades) a suíte:
+# - mede o tempo de geração da rede e, em uma geração à parte, o pico de memória (tracemalloc)
+# - sorteia muitos pares (origem, destino) com seed
+# - roda cada motor em cada representação e modelo (saltos/fricção), com aquecimento
+# - reporta mediana, p95, p99, média (perf_counter_ns) e vazão em consultas/s
+# Com --instrumentar, uma passada extra (fora da medição de tempo) soma os contadores dos
+# motores (parâmetro metricas, Instrumentacao.py) e os tempos das fases geração/busca/
+# reconstrução.
+# Com --proporcao-intra, os pares vêm da carga estratificada (CargaConsultas.py): fração
+# intra/inter comunidade, faixas de grau da origem e sem aresta direta.
+# O modo --comparar confronta o resultado com um JSON de referência, aponta regressões e
+# linhas sem correspondente; sem nenhuma linha comparável, termina com código 1.
+
+import argparse
+import csv
+import json
+import math
+import random
+import sys
 import time
-
-from Algoritmos import dijkstra, reconstruir_caminho_prev
-from RedeSocial import gerar_rede_social
-
-# Quantidade de rodadas por cenário para tirar média.
-RODADAS = 10
-
-# Nome do arquivo de log gerado pelo benchmark.
-LOG_FILE = "benchmark_rede_social.txt"
-
-
-# Executa Dijkstra em um grafo para um par (origem, destino) e retorna métricas de benchmark.
-def executar_dijkstra(grafo, origem, destino):
-    # Marca o tempo inicial (timestamp).
-    inicio = time.time()
-
-    # Executa Dijkstra a partir da origem retornando distâncias e predecessores.
-    dist, prev = dijkstra(grafo, origem)
-
-    # Marca o tempo final após o cálculo.
-    fim = time.time()
-
-    # Reconstrói o caminho final (lista de nós) usando o vetor de predecessores.
-    caminho = reconstruir_caminho_prev(prev, origem, destino)
-
-    # Calcula hops como quantidade de arestas (nós-1). Se não tem caminho, deixa None.
-    hops = len(caminho) - 1 if caminho else None
-
-    # Captura o custo total até o destino usando o array dist do Dijkstra.
-    custo = dist[destino]
-
-    # Retorna tempo gasto (fim-inicio), custo, hops e o caminho em si.
-    return fim - inicio, custo, hops, caminho
-
-
-# Roda o benchmark de um caso completo (saltos e fricção) e escreve no log.
-def benchmark_caso(nome, grafo_saltos, grafo_friccao, origem, destino, log):
-
-    # Linha separadora para padronizar log e facilitar leitura.
-    log.write("=" * 90 + "\n")
-
-    # Escreve o nome do caso (ex.: CASO 1 — Mesma Comunidade).
-    log.write(f"{nome}\n")
-
-    # Escreve origem e destino usados no caso.
-    log.write(f"Origem={origem} | Destino={destino}\n")
-
-    # Fecha a “capa” do caso com outra linha separadora.
-    log.write("=" * 90 + "\n")
-
-    # ---------------- SALTOS ----------------
-    # Inicia seção baseline.
-    log.write("Executando Dijkstra (Saltos | peso=1)\n")
-
-    # Cabeçalho da tabela por rodada.
-    log.write("Rodada | Tempo(s) | Custo | Hops | Status\n")
-
-    # Vetores para acumular métricas e calcular média.
-    tempos_s, custos_s, hops_s = [], [], []
-
-    # Loop das RODADAS para baseline (saltos).
-    for i in range(RODADAS):
-        # Executa Dijkstra no grafo baseline.
-        t, c, h, _ = executar_dijkstra(grafo_saltos, origem, destino)
-
-        # Armazena tempo para cálculo de média.
-        tempos_s.append(t)
-
-        # Armazena custo para cálculo de média.
-        custos_s.append(c)
-
-        # Armazena hops para cálculo de média.
-        hops_s.append(h)
-
-        # Escreve linha da rodada formatada.
-        log.write(f"{i + 1:<6} | {t:.6f} | {c} | {h} | OK\n")
-
-    # Após as rodadas, escreve as médias baseline.
-    log.write(
-        f"MÉDIA SALTOS: Tempo={sum(tempos_s) / RODADAS:.6f} | "
-        f"Custo={sum(custos_s) / RODADAS:.2f} | "
-        f"Hops={sum(hops_s) / RODADAS:.2f}\n\n"
-    )
-
-    # ---------------- FRICÇÃO ----------------
-    # Inicia seção fricção.
-    log.write("Executando Dijkstra (Fricção | peso calculado)\n")
-
-    # Cabeçalho da tabela por rodada para fricção.
-    log.write("Rodada | Tempo(s) | Custo | Hops | Status\n")
-
-    # Vetores para acumular métricas e calcular média (fricção).
-    tempos_f, custos_f, hops_f = [], [], []
-
-    # Loop das RODADAS para fricção.
-    for i in range(RODADAS):
-        # Executa Dijkstra no grafo ponderado por fricção.
-        t, c, h, _ = executar_dijkstra(grafo_friccao, origem, destino)
-
-        # Armazena tempo.
-        tempos_f.append(t)
-
-        # Armazena custo (float).
-        custos_f.append(c)
-
-        # Armazena hops.
-        hops_f.append(h)
-
-        # Escreve linha da rodada com custo formatado.
-        log.write(f"{i + 1:<6} | {t:.6f} | {c:.6f} | {h} | OK\n")
-
-    # Após as rodadas, escreve as médias fricção.
-    log.write(
-        f"MÉDIA FRICÇÃO: Tempo={sum(tempos_f) / RODADAS:.6f} | "
-        f"Custo={sum(custos_f) / RODADAS:.4f} | "
-        f"Hops={sum(hops_f) / RODADAS:.2f}\n\n"
-    )
-
-
-# Seleciona par dentro da mesma comunidade (primeiro e último nó).
-def _primeiro_par_mesma_comunidade(comunidade_por_no, alvo_comunidade=0):
-    # Filtra os nós da comunidade alvo.
-    nos = [i for i, c in enumerate(comunidade_por_no) if c == alvo_comunidade]
-
-    # Se insuficiente, fallback trivial.
-    if len(nos) < 2:
-        return (0, 1)
-
-    # Usa extremos para aumentar distância interna no bloco.
-    return (nos[0], nos[-1])
-
-
-# Seleciona par em comunidades diferentes sem aresta direta (evita hop=1).
-def _par_comunidades_diferentes_sem_aresta(grafo_saltos, comunidade_por_no, c1=0, c2=1, tentativas=10000):
-    # Filtra nós da comunidade 1.
-    nos1 = [i for i, c in enumerate(comunidade_por_no) if c == c1]
-
-    # Filtra nós da comunidade 2.
-    nos2 = [i for i, c in enumerate(comunidade_por_no) if c == c2]
-
-    # Se alguma lista vazia, fallback.
-    if not nos1 or not nos2:
-        return (0, len(comunidade_por_no) - 1)
-
-    # Loop de tentativas para achar um par sem aresta direta.
-    i1 = 0
-    i2 = 0
-    while tentativas > 0:
-        # Seleciona u ciclando.
-        u = nos1[i1 % len(nos1)]
-
-        # Seleciona v ciclando.
-        v = nos2[i2 % len(nos2)]
-
-        # Se não tem aresta direta, ok.
-        if not grafo_saltos.possuiAresta(u, v):
-            return (u, v)
-
-        # Incrementos para diversificar a busca.
-        i1 += 17
-        i2 += 31
-
-        # Decrementa tentativas para garantir término.
-        tentativas -= 1
-
-    # Se falhar, retorna primeiro par (mesmo que tenha aresta direta).
-    return (nos1[0], nos2[0])
+import tracemalloc
+
+from Algoritmos import dijkstra, dijkstra_heap, dijkstra_bidirecional, caminhos_minimos, reconstruir_caminho_prev
+from Grafo import GrafoCSR
+from CargaConsultas import IndiceComunidades, gerar_pares
+from Instrumentacao import Metricas, consulta_instrumentada
+from Landmarks import preprocessar_alt, astar_alt
+from RedeSocial import gerar_rede_social, gerar_rede_social_camadas
+
+# Parâmetros padrão da suíte.
+TAMANHOS = [500, 1000]
+DENSIDADES = [0.04]
+COMUNIDADES = [3]
+MOTORES = ["dijkstra_heap", "caminhos_minimos", "bidirecional", "alt"]
+REPRESENTACOES = ["lista", "camadas", "csr"]
+MODELOS = ["saltos", "friccao"]
+PARES = 100
+AQUECIMENTO = 5
+SEED = 42
+
+# Parâmetros fixos da rede (mesmos do Main.py).
+PARAMETROS_REDE = {
+    "p_inter": 0.002,
+    "max_pontes_por_par": 10,
+    "interacao_intra_min": 20,
+    "interacao_intra_max": 100,
+    "interacao_inter_min": 0,
+    "interacao_inter_max": 5,
+    "friccao_alpha": 30.0,
+}
+
+# Arquivo de saída padrão.
+SAIDA = "benchmark_rede_social.json"
+
+# Tolerância padrão do modo --comparar (10% de piora na mediana).
+TOLERANCIA = 0.10
+
+# Campos que identificam uma linha de resultado (usados na comparação).
+CHAVE = ("num_vertices", "p_intra", "num_comunidades", "carga", "representacao", "motor", "modelo")
+
+
+# -----------------------------
+# Motores: (grafo, origem, destino, contexto) -> custo
+# -----------------------------
+def _motor_dijkstra(grafo, origem, destino, contexto):
+    distancias, predecessor = dijkstra(grafo, origem)
+    reconstruir_caminho_prev(predecessor, origem, destino)
+    return distancias[destino]
+
+
+def _motor_dijkstra_heap(grafo, origem, destino, contexto):
+    distancias, predecessor = dijkstra_heap(grafo, origem, destino)
+    reconstruir_caminho_prev(predecessor, origem, destino)
+    return distancias[destino]
+
+
+def _motor_caminhos_minimos(grafo, origem, destino, contexto):
+    distancias, predecessor = caminhos_minimos(grafo, origem, destino)
+    reconstruir_caminho_prev(predecessor, origem, destino)
+    return distancias[destino]
+
+
+def _motor_bidirecional(grafo, origem, destino, contexto):
+    custo, predecessor = dijkstra_bidirecional(grafo, origem, destino)
+    reconstruir_caminho_prev(predecessor, origem, destino)
+    return custo
+
+
+def _motor_alt(grafo, origem, destino, contexto):
+    # Índice ALT por grafo, calculado uma vez (fora da medição, no aquecimento).
+    indice = contexto.get(id(grafo))
+    if indice is None:
+        indice = preprocessar_alt(grafo, 8, contexto["comunidade_por_no"])
+        contexto[id(grafo)] = indice
+    custo, predecessor = astar_alt(grafo, indice, origem, destino)
+    reconstruir_caminho_prev(predecessor, origem, destino)
+    return custo
+
+
+MOTORES_DISPONIVEIS = {
+    "dijkstra": _motor_dijkstra,
+    "dijkstra_heap": _motor_dijkstra_heap,
+    "caminhos_minimos": _motor_caminhos_minimos,
+    "bidirecional": _motor_bidirecional,
+    "alt": _motor_alt,
+}
+
+# Motores que aceitam metricas (contadores de Instrumentacao.py).
+MOTORES_INSTRUMENTADOS = {
+    "dijkstra_heap": dijkstra_heap,
+    "caminhos_minimos": caminhos_minimos,
+}
+
+
+# -----------------------------
+# Representações: gera a rede e devolve {modelo: grafo}
+# -----------------------------
+def _gerar(representacao, num_vertices, p_intra, num_comunidades, seed):
+    parametros = dict(PARAMETROS_REDE, num_vertices=num_vertices, p_intra=p_intra,
+                      num_comunidades=num_comunidades, seed=seed)
+
+    if representacao == "lista":
+        grafo_friccao, grafo_saltos, comunidade_por_no = gerar_rede_social(**parametros)
+        return {"saltos": grafo_saltos, "friccao": grafo_friccao}, comunidade_por_no
+
+    grafo, comunidade_por_no = gerar_rede_social_camadas(**parametros)
+    grafos = {modelo: grafo.camada(modelo) for modelo in MODELOS}
+    if representacao == "csr":
+        grafos = {modelo: GrafoCSR(camada) for modelo, camada in grafos.items()}
+    return grafos, comunidade_por_no
+
+
+# -----------------------------
+# Estatísticas
+# -----------------------------
+def _percentil(ordenados, p):
+    # Percentil pelo método do posto mais próximo (nearest-rank).
+    if not ordenados:
+        return 0
+    # posto = ceil(p/100 * n), em aritmética inteira para p inteiro (sem arredondamento bancário).
+    posicao = max(0, min(len(ordenados) - 1, math.ceil(p * len(ordenados) / 100) - 1))
+    return ordenados[posicao]
+
+
+def _estatisticas(tempos_ns):
+    ordenados = sorted(tempos_ns)
+    total_ns = sum(ordenados)
+    return {
+        "consultas": len(ordenados),
+        "mediana_ns": _percentil(ordenados, 50),
+        "p95_ns": _percentil(ordenados, 95),
+        "p99_ns": _percentil(ordenados, 99),
+        "media_ns": total_ns // len(ordenados) if ordenados else 0,
+        "vazao_qps": len(ordenados) / (total_ns / 1e9) if total_ns else 0.0,
+    }
+
+
+# Sorteia pares (origem, destino) distintos com seed.
+def sortear_pares(num_vertices, quantidade, seed):
+    rnd = random.Random(seed)
+    pares = []
+    while len(pares) < quantidade:
+        origem = rnd.randrange(num_vertices)
+        destino = rnd.randrange(num_vertices)
+        if origem != destino:
+            pares.append((origem, destino))
+    return pares
+
+
+# -----------------------------
+# Execução de um cenário
+# -----------------------------
+def executar_cenario(num_vertices, p_intra, num_comunidades, representacoes, motores,
+                     pares_por_consulta, aquecimento, seed, instrumentar=False, callback=None,
+                     proporcao_intra=None):
+    """
+    Retorna uma linha (dict) por representação x motor x modelo.
+    proporcao_intra: se informado, usa a carga estratificada (senão, pares uniformes).
+    instrumentar: acrescenta às linhas as médias dos contadores por consulta.
+    callback: chamado por consulta instrumentada com (origem, destino, metricas) e, uma vez
+              por representação, com (None, None, metricas) da fase "geracao".
+    """
+    linhas = []
+    if proporcao_intra is None:
+        carga = "uniforme"
+        pares = sortear_pares(num_vertices, pares_por_consulta, seed)
+    else:
+        # Depende da rede: sorteada após a primeira geração (a mesma em todas as representações).
+        carga = f"intra={proporcao_intra:g}"
+        pares = None
+
+    for representacao in representacoes:
+        # Pico de memória (rede + representação) em uma geração separada com tracemalloc:
+        # o rastreamento deixa as alocações várias vezes mais lentas e distorceria o tempo.
+        tracemalloc.start()
+        _gerar(representacao, num_vertices, p_intra, num_comunidades, seed)
+        _, memoria_pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Tempo de geração sem rastreamento (a mesma rede, pela seed), como fase "geracao".
+        geracao = Metricas()
+        with geracao.fase("geracao"):
+            grafos, comunidade_por_no = _gerar(representacao, num_vertices, p_intra, num_comunidades, seed)
+        tempo_geracao_ns = geracao.tempos_ns["geracao"]
+        if instrumentar and callback is not None:
+            callback(None, None, geracao.como_dict())
+
+        if pares is None:
+            indice = IndiceComunidades(comunidade_por_no, grafos["saltos"])
+            pares = list(gerar_pares(indice, pares_por_consulta, seed, proporcao_intra))
+
+        for nome_motor in motores:
+            motor = MOTORES_DISPONIVEIS[nome_motor]
+            contexto = {"comunidade_por_no": comunidade_por_no}
+
+            for modelo in MODELOS:
+                grafo = grafos[modelo]
+
+                # Aquecimento (inclui pré-processamento do motor, quando houver).
+                for origem, destino in pares[:aquecimento]:
+                    motor(grafo, origem, destino, contexto)
+
+                tempos_ns = []
+                for origem, destino in pares:
+                    inicio = time.perf_counter_ns()
+                    motor(grafo, origem, destino, contexto)
+                    tempos_ns.append(time.perf_counter_ns() - inicio)
+
+                linha = {
+                    "num_vertices": num_vertices,
+                    "p_intra": p_intra,
+                    "num_comunidades": num_comunidades,
+                    "carga": carga,
+                    "representacao": representacao,
+                    "motor": nome_motor,
+                    "modelo": modelo,
+                    "num_arestas": grafo.tamanho(),
+                    "tempo_geracao_ns": tempo_geracao_ns,
+                    "memoria_pico_bytes": memoria_pico,
+                }
+                linha.update(_estatisticas(tempos_ns))
+                if instrumentar and nome_motor in MOTORES_INSTRUMENTADOS:
+                    linha.update(_instrumentar(grafo, pares, MOTORES_INSTRUMENTADOS[nome_motor], callback, geracao))
+                linhas.append(linha)
+
+                print(
+                    f"V={num_vertices:<6} p={p_intra:<6} C={num_comunidades:<3} {representacao:<8} "
+                    f"{nome_motor:<17} {modelo:<8} mediana={linha['mediana_ns'] / 1e6:.3f}ms "
+                    f"p95={linha['p95_ns'] / 1e6:.3f}ms vazao={linha['vazao_qps']:.1f}q/s"
+                )
+
+    return linhas
+
+
+# Passada instrumentada: médias dos contadores por consulta e tempo total de cada fase
+# (a fase "geracao" vem da geração da rede do cenário).
+def _instrumentar(grafo, pares, motor, callback, geracao):
+    metricas = Metricas()
+    metricas.somar(geracao)
+    for origem, destino in pares:
+        consulta_instrumentada(grafo, origem, destino, metricas, callback, motor)
+
+    resultado = {}
+    for campo, valor in metricas.como_dict().items():
+        if campo == "consultas":
+            continue
+        if campo == "max_fronteira" or campo.startswith("tempo_"):
+            resultado[campo] = valor
+        else:
+            resultado["media_" + campo] = valor / metricas.consultas
+    return resultado
+
+
+# -----------------------------
+# Saída e comparação
+# -----------------------------
+def salvar_json(caminho, linhas, parametros):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump({"parametros": parametros, "resultados": linhas}, arquivo, indent=2, ensure_ascii=False)
+
+
+def salvar_csv(caminho, linhas):
+    if not linhas:
+        return
+    with open(caminho, "w", encoding="utf-8", newline="") as arquivo:
+        # Linhas instrumentadas têm colunas extras: cabeçalho = união das colunas, em ordem.
+        colunas = list(dict.fromkeys(campo for linha in linhas for campo in linha))
+        escritor = csv.DictWriter(arquivo, fieldnames=colunas, restval="")
+        escritor.writeheader()
+        escritor.writerows(linhas)
+
+
+def comparar(linhas, caminho_referencia, tolerancia):
+    """
+    Retorna (regressões, sem_referencia, comparadas):
+    - regressões: (linha, anterior, razao) com mediana atual > referência * (1 + tolerancia)
+    - sem_referencia: linhas atuais sem linha correspondente (mesma CHAVE) na referência
+    - comparadas: quantidade de linhas efetivamente comparadas
+    """
+    with open(caminho_referencia, "r", encoding="utf-8") as arquivo:
+        referencia = json.load(arquivo)["resultados"]
+
+    por_chave = {tuple(linha.get(campo) for campo in CHAVE): linha for linha in referencia}
+    regressoes = []
+    sem_referencia = []
+    comparadas = 0
+    for linha in linhas:
+        anterior = por_chave.get(tuple(linha.get(campo) for campo in CHAVE))
+        if anterior is None or not anterior["mediana_ns"]:
+            sem_referencia.append(linha)
+            continue
+        comparadas += 1
+        razao = linha["mediana_ns"] / anterior["mediana_ns"]
+        if razao > 1.0 + tolerancia:
+            regressoes.append((linha, anterior, razao))
+    return regressoes, sem_referencia, comparadas
+
+
+def _lista(tipo):
+    # Converte "a,b,c" em lista tipada (argparse).
+    return lambda texto: [tipo(item) for item in texto.split(",") if item]
+
+
+def _argumentos(argv):
+    parser = argparse.ArgumentParser(description="Suíte de benchmark da rede social (saltos x fricção).")
+    parser.add_argument("--tamanhos", type=_lista(int), default=TAMANHOS)
+    parser.add_argument("--densidades", type=_lista(float), default=DENSIDADES)
+    parser.add_argument("--comunidades", type=_lista(int), default=COMUNIDADES)
+    parser.add_argument("--motores", type=_lista(str), default=MOTORES,
+                        help="Disponíveis: " + ", ".join(MOTORES_DISPONIVEIS))
+    parser.add_argument("--representacoes", type=_lista(str), default=REPRESENTACOES)
+    parser.add_argument("--pares", type=int, default=PARES)
+    parser.add_argument("--proporcao-intra", type=float, default=None,
+                        help="Carga estratificada com essa fração de pares intra-comunidade.")
+    parser.add_argument("--aquecimento", type=int, default=AQUECIMENTO)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--saida", default=SAIDA, help="Arquivo JSON de resultados.")
+    parser.add_argument("--csv", default=None, help="Arquivo CSV de resultados (opcional).")
+    parser.add_argument("--comparar", default=None, help="JSON de referência para detectar regressões.")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="Acrescenta contadores (assentados, relaxações, heap...) às linhas.")
+    return parser.parse_args(argv)
 
 
 # Função principal do benchmark.
-def main():
-
-    # ---------------- PARÂMETROS DA REDE ----------------
-    # Define o tamanho padrão do benchmark.
-    num_vertices = 1000
-
-    # Número de comunidades.
-    num_comunidades = 3
-
-    # Densidade intra-comunidade.
-    p_intra = 0.04
-
-    # Fator de amostragem para pontes inter-comunidades.
-    p_inter = 0.002
-
-    # Cap de pontes por par de comunidades.
-    max_pontes_por_par = 10
-
-    # Seed para reprodutibilidade.
-    seed = 42
-
-    # Range de interações fortes (intra).
-    interacao_intra_min = 20
-    interacao_intra_max = 100
-
-    # Range de interações fracas (inter).
-    interacao_inter_min = 0
-    interacao_inter_max = 5
-
-    # Intensidade do impacto da fricção no peso.
-    friccao_alpha = 30.0
-
-    # Gera os grafos para baseline e fricção + mapa de comunidade.
-    grafo_friccao, grafo_saltos, comunidade_por_no = gerar_rede_social(
-        num_vertices=num_vertices,
-        num_comunidades=num_comunidades,
-        p_intra=p_intra,
-        p_inter=p_inter,
-        max_pontes_por_par=max_pontes_por_par,
-        seed=seed,
-        interacao_intra_min=interacao_intra_min,
-        interacao_intra_max=interacao_intra_max,
-        interacao_inter_min=interacao_inter_min,
-        interacao_inter_max=interacao_inter_max,
-        friccao_alpha=friccao_alpha
-    )
-
-    # --------- DEFINIÇÃO DOS PARES ---------
-    # Caso 1: par dentro da mesma comunidade.
-    origem1, destino1 = _primeiro_par_mesma_comunidade(comunidade_por_no, alvo_comunidade=0)
-
-    # Caso 2: par entre comunidades diferentes sem aresta direta.
-    origem2, destino2 = _par_comunidades_diferentes_sem_aresta(grafo_saltos, comunidade_por_no, c1=0, c2=1)
-
-    # Abre o arquivo de log para escrita (sobrescreve).
-    with open(LOG_FILE, "w", encoding="utf-8") as log:
-        # Cabeçalho geral do benchmark.
-        log.write("BENCHMARK — CAMINHO MAIS EFICIENTE PARA VIRALIZAÇÃO\n")
-
-        # Informa número de rodadas por cenário.
-        log.write(f"Rodadas por cenário: {RODADAS}\n")
-
-        # Informa o modelo comparado.
-        log.write("Modelo: Grafo não-direcionado | Baseline(peso=1) vs Fricção(peso calculado)\n\n")
-
-        # Executa benchmark do Caso 1 e escreve no log.
-        benchmark_caso(
-            "CASO 1 — Mesma Comunidade",
-            grafo_saltos, grafo_friccao,
-            origem1, destino1, log
-        )
-
-        # Executa benchmark do Caso 2 e escreve no log.
-        benchmark_caso(
-            "CASO 2 — Comunidades Diferentes",
-            grafo_saltos, grafo_friccao,
-            origem2, destino2, log
-        )
-
-    # Feedback final no console indicando onde o log foi salvo.
-    print(f"Benchmark finalizado. Log salvo em: {LOG_FILE}")
+def main(argv=None):
+    args = _argumentos(argv)
+
+    for motor in args.motores:
+        if motor not in MOTORES_DISPONIVEIS:
+            raise SystemExit(f"Motor desconhecido: {motor}")
+    for representacao in args.representacoes:
+        if representacao not in REPRESENTACOES:
+            raise SystemExit(f"Representação desconhecida: {representacao}")
+
+    linhas = []
+    for num_vertices in args.tamanhos:
+        for p_intra in args.densidades:
+            for num_comunidades in args.comunidades:
+                linhas.extend(executar_cenario(
+                    num_vertices, p_intra, num_comunidades, args.representacoes, args.motores,
+                    args.pares, args.aquecimento, args.seed, args.instrumentar,
+                    proporcao_intra=args.proporcao_intra
+                ))
+
+    parametros = dict(vars(args), rede=PARAMETROS_REDE, python=sys.version.split()[0])
+    salvar_json(args.saida, linhas, parametros)
+    if args.csv:
+        salvar_csv(args.csv, linhas)
+    print(f"Benchmark finalizado. Resultados salvos em: {args.saida}")
+
+    if args.comparar:
+        regressoes, sem_referencia, comparadas = comparar(linhas, args.comparar, args.tolerancia)
+        for linha in sem_referencia:
+            print("SEM REFERÊNCIA: " + " | ".join(f"{campo}={linha[campo]}" for campo in CHAVE))
+        if sem_referencia:
+            print(f"{len(sem_referencia)} de {len(linhas)} linhas sem correspondente na referência.")
+        if not comparadas:
+            # Parâmetros diferentes da referência (tamanhos, motores, carga...): nada foi comparado.
+            print("Nenhuma linha comparável com a referência.")
+            return 1
+        for linha, anterior, razao in regressoes:
+            print(
+                "REGRESSÃO: " + " | ".join(f"{campo}={linha[campo]}" for campo in CHAVE)
+                + f" | mediana {anterior['mediana_ns'] / 1e6:.3f}ms -> {linha['mediana_ns'] / 1e6:.3f}ms ({razao:.2f}x)"
+            )
+        if regressoes:
+            return 1
+        print("Sem regressões em relação à referência.")
+    return 0
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
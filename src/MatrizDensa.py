@@ -0,0 +1,170 @@
+# -----------------------------------------------------------------------------------------
+# MatrizDensa.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa uma matriz de adjacências densa em NumPy e um Dijkstra vetorizado.
+
+# Indicada para grafos densos (ex.: redes ego), onde a forma de matriz faz sentido:
+# - pesos em float32 numa única matriz V x V; SEM_ARESTA (infinito) marca ausência de aresta
+#   (diferente de MatrizAdjacencias, aqui peso 0 é uma aresta válida)
+# - dijkstra_densa faz, a cada passo, a escolha do vértice (argmin) e a relaxação da linha
+#   inteira (minimum) como operações de vetor: O(V) passos de custo O(V) em C
+# - conversão em bloco de/para ListaAdjacencias e MatrizAdjacencias
+# NumPy é opcional: o módulo importa sem ele e só falha ao construir uma MatrizDensa.
+
+try:
+    import numpy as np
+except ImportError:  # NumPy não instalado
+    np = None
+
+from Algoritmos import INF
+from Grafo import ListaAdjacencias, MatrizAdjacencias
+
+# Marca de "sem aresta" na matriz de pesos.
+SEM_ARESTA = INF
+
+
+def _exigir_numpy():
+    if np is None:
+        raise ImportError("MatrizDensa requer NumPy (pip install numpy).")
+
+
+class MatrizDensa:
+    def __init__(self, numVertices):
+        _exigir_numpy()
+        self.numVertices = numVertices
+        self.numArestas = 0
+        self.pesos = np.full((numVertices, numVertices), SEM_ARESTA, dtype=np.float32)
+        # Permanece True enquanto todas as arestas tiverem peso 1 (permite usar BFS).
+        self.pesosUnitarios = True
+        # Contador de alterações (invalida caches de caminhos mínimos).
+        self.versao = 0
+
+    @classmethod
+    def deGrafo(cls, grafo):
+        """
+        Converte em bloco uma ListaAdjacencias, MatrizAdjacencias (ou qualquer grafo com
+        vizinhos). Arestas paralelas ficam com o menor peso (mesmos caminhos mínimos).
+        """
+        numVertices = grafo.ordem()
+        densa = cls(numVertices)
+
+        if isinstance(grafo, MatrizAdjacencias):
+            # Na matriz da disciplina, 0 significa "sem aresta".
+            matriz = np.asarray(grafo.matriz, dtype=np.float32)
+            densa.pesos = np.where(matriz != 0, matriz, np.float32(SEM_ARESTA))
+        else:
+            origens = []
+            destinos = []
+            pesos = []
+            for v in range(numVertices):
+                for (v2, peso) in grafo.vizinhos(v):
+                    origens.append(v)
+                    destinos.append(v2)
+                    pesos.append(peso)
+            np.minimum.at(densa.pesos, (np.asarray(origens, dtype=np.intp), np.asarray(destinos, dtype=np.intp)),
+                          np.asarray(pesos, dtype=np.float32))
+
+        existe = densa.pesos != SEM_ARESTA
+        densa.numArestas = int(np.count_nonzero(existe))
+        densa.pesosUnitarios = bool(np.all(densa.pesos[existe] == 1))
+        return densa
+
+    def paraListaAdjacencias(self):
+        # Arestas em ordem de (origem, destino); pesos convertidos para float do Python.
+        lista = ListaAdjacencias(self.numVertices)
+        origens, destinos = np.nonzero(self.pesos != SEM_ARESTA)
+        pesos = self.pesos[origens, destinos].tolist()
+        if self.pesosUnitarios:
+            pesos = [1] * len(pesos)
+        for v, v2, peso in zip(origens.tolist(), destinos.tolist(), pesos):
+            lista.lista[v].append((v2, peso))
+        lista.numArestas = len(pesos)
+        lista.pesosUnitarios = self.pesosUnitarios
+        return lista
+
+    def ordem(self):
+        return self.numVertices
+
+    def tamanho(self):
+        return self.numArestas
+
+    def densidade(self):
+        maxArestas = self.numVertices * (self.numVertices - 1)
+        return self.numArestas / maxArestas
+
+    def addAresta(self, v1, v2, peso=1):
+        self.versao += 1
+        if self.pesos[v1, v2] == SEM_ARESTA:
+            self.numArestas += 1
+        self.pesos[v1, v2] = peso
+        if peso != 1:
+            self.pesosUnitarios = False
+
+    def possuiAresta(self, v1, v2):
+        return bool(self.pesos[v1, v2] != SEM_ARESTA)
+
+    def vizinhos(self, v):
+        # Compatível com os motores genéricos (lista de (vizinho, peso)).
+        linha = self.pesos[v]
+        indices = np.nonzero(linha != SEM_ARESTA)[0]
+        if self.pesosUnitarios:
+            return [(i, 1) for i in indices.tolist()]
+        return list(zip(indices.tolist(), linha[indices].tolist()))
+
+    def grau(self, v):
+        return int(np.count_nonzero(self.pesos[v] != SEM_ARESTA))
+
+    def memoriaBytes(self):
+        return self.pesos.nbytes
+
+    def printGrafo(self):
+        for i in range(self.numVertices):
+            print(" ".join("-" if x == SEM_ARESTA else f"{x:g}" for x in self.pesos[i].tolist()))
+
+
+# -----------------------------------------------------------------------------------------
+# Dijkstra denso vetorizado
+# -----------------------------------------------------------------------------------------
+def dijkstra_densa(matriz, origem, destino=None):
+    """
+    Mesmo contrato de dijkstra(): retorna (distancias, predecessor) como listas Python
+    (INF e None para vértices não alcançados).
+
+    A cada passo: argmin sobre os abertos e relaxação da linha inteira do vértice escolhido
+    com np.minimum. As distâncias são acumuladas em float64 sobre pesos float32 (diferenças
+    da ordem de 1e-7 relativas em relação aos motores em float do Python).
+    Se destino for informado, a busca para assim que o destino é fechado.
+    """
+    total_vertices = matriz.numVertices
+    pesos = matriz.pesos
+    distancias = np.full(total_vertices, INF)
+    predecessor = np.full(total_vertices, -1, dtype=np.int64)
+    distancias[origem] = 0.0
+    predecessor[origem] = origem
+
+    # Distâncias dos abertos (fechados viram INF para o argmin ignorá-los).
+    abertos = distancias.copy()
+
+    for _ in range(total_vertices):
+        vertice_atual = int(np.argmin(abertos))
+        distancia_atual = abertos[vertice_atual]
+        if distancia_atual == INF:
+            break
+        abertos[vertice_atual] = INF
+        if vertice_atual == destino:
+            break
+
+        # Relaxação da linha inteira. Com pesos não-negativos, vértices fechados nunca melhoram.
+        alternativas = distancia_atual + pesos[vertice_atual]
+        melhora = alternativas < distancias
+        np.minimum(distancias, alternativas, out=distancias)
+        abertos[melhora] = distancias[melhora]
+        predecessor[melhora] = vertice_atual
+
+    predecessor_lista = [None if p < 0 else p for p in predecessor.tolist()]
+    return distancias.tolist(), predecessor_lista
@@ -0,0 +1,162 @@
+# -----------------------------------------------------------------------------------------
+# MultiCriterio.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa buscas que combinam hops e fricção:
+# - fronteira de Pareto (hops, custo) em uma única busca
+# - caminhos de menor custo com limite de hops (Bellman-Ford em camadas)
+
+# Em vez de rodar Dijkstra duas vezes (grafo de saltos e grafo de fricção), uma única busca
+# por rótulos (label-setting, estilo Martins) percorre a topologia uma vez só:
+# - cada rótulo é (hops, custo, vértice) e os rótulos saem do heap em ordem (hops, custo)
+# - como os rótulos já fechados num vértice têm hops <= ao atual, um novo rótulo só é
+#   não-dominado se tiver custo MENOR que todos eles (basta guardar o menor custo por vértice)
+# - rótulos com custo >= ao melhor custo já fechado no destino também são dominados
+# O resultado vai do caminho com menos hops (ponta "saltos") ao de menor custo (ponta "fricção").
+
+from heapq import heappush, heappop
+
+from Algoritmos import INF, bfs, dijkstra_heap
+
+
+# Reconstrói o caminho de um rótulo seguindo os rótulos pais.
+def _caminho_do_rotulo(rotulos, indice):
+    caminho = []
+    while indice is not None:
+        vertice, pai = rotulos[indice]
+        caminho.append(vertice)
+        indice = pai
+    caminho.reverse()
+    return caminho
+
+
+# Busca a fronteira de Pareto (hops, custo) entre origem e destino.
+def fronteira_pareto(grafo, origem, destino, max_fronteira=None):
+    """
+    grafo: grafo ponderado por custo (ex.: grafo_friccao); cada aresta conta 1 hop.
+    max_fronteira: se informado, para após esse número de pontos (os de menos hops).
+
+    Retorna lista de (hops, custo, caminho), ordenada por hops crescente (custo decrescente).
+    Lista vazia se o destino não for alcançável.
+    """
+    # Menor custo entre os rótulos já fechados em cada vértice.
+    melhor_custo = [INF] * grafo.numVertices
+
+    # rotulos[i] = (vértice, índice do rótulo pai) para reconstruir os caminhos.
+    rotulos = [(origem, None)]
+    heap = [(0, 0, 0)]  # (hops, custo, índice do rótulo)
+    fronteira = []
+
+    while heap:
+        hops, custo, indice = heappop(heap)
+        vertice_atual = rotulos[indice][0]
+
+        # Dominado por um rótulo já fechado no vértice ou no destino.
+        if custo >= melhor_custo[vertice_atual] or custo >= melhor_custo[destino]:
+            continue
+        melhor_custo[vertice_atual] = custo
+
+        if vertice_atual == destino:
+            fronteira.append((hops, custo, _caminho_do_rotulo(rotulos, indice)))
+            if max_fronteira is not None and len(fronteira) >= max_fronteira:
+                break
+            continue
+
+        for (vizinho, peso) in grafo.vizinhos(vertice_atual):
+            custo_alternativo = custo + peso
+            # Poda antecipada pela mesma regra de dominância.
+            if custo_alternativo >= melhor_custo[vizinho] or custo_alternativo >= melhor_custo[destino]:
+                continue
+            rotulos.append((vizinho, indice))
+            heappush(heap, (hops + 1, custo_alternativo, len(rotulos) - 1))
+
+    return fronteira
+
+
+# Reconstrói o caminho do nível k seguindo os pais de cada nível do DP.
+def _caminho_do_nivel(pais, origem, destino, k):
+    caminho = [destino]
+    vertice_atual = destino
+    while k > 0:
+        # Vértice melhorado no nível k: o passo anterior vem do pai, no nível k-1.
+        pai = pais[k - 1].get(vertice_atual)
+        if pai is not None:
+            caminho.append(pai)
+            vertice_atual = pai
+        k -= 1
+    if vertice_atual != origem:
+        return []
+    caminho.reverse()
+    return caminho
+
+
+# Caminhos de menor fricção usando no máximo k hops, para todo k até max_hops.
+def caminhos_limitados_por_hops(grafo, origem, destino, max_hops, podar=True):
+    """
+    Bellman-Ford em camadas: o nível k guarda o menor custo com no máximo k hops, e só os
+    vértices melhorados no nível anterior (fronteira) são relaxados.
+
+    Com podar=True, calcula antes (a partir do destino, grafo não-direcionado) o custo
+    mínimo sem limite de hops e a distância em hops até o destino, e descarta rótulos que
+    não conseguem melhorar a resposta: custo + limite_inferior >= melhor custo atual no
+    destino, ou hops insuficientes para chegar ao destino dentro de max_hops.
+
+    Retorna lista indexada por k (0..max_hops) de (custo, hops, caminho); custo INF e
+    caminho [] quando não há caminho com até k hops.
+    """
+    total_vertices = grafo.numVertices
+
+    if podar:
+        limite_custo, _ = dijkstra_heap(grafo, destino)
+        limite_hops, _ = bfs(grafo, destino)
+
+    custos = [INF] * total_vertices
+    custos[origem] = 0
+
+    # pais[k-1] = {vértice melhorado no nível k: vértice anterior no nível k-1}
+    pais = []
+    fronteira = [origem]
+
+    caminho = [origem] if origem == destino else []
+    resultado = [(custos[destino], len(caminho) - 1 if caminho else None, caminho)]
+
+    for k in range(1, max_hops + 1):
+        melhor_destino = custos[destino]
+        novos_custos = {}
+        novos_pais = {}
+
+        for u in fronteira:
+            custo_u = custos[u]
+            for (v, peso) in grafo.vizinhos(u):
+                custo_alternativo = custo_u + peso
+                if custo_alternativo >= custos[v] or custo_alternativo >= novos_custos.get(v, INF):
+                    continue
+                if podar and (
+                    custo_alternativo + limite_custo[v] >= melhor_destino
+                    or k + limite_hops[v] > max_hops
+                ):
+                    continue
+                novos_custos[v] = custo_alternativo
+                novos_pais[v] = u
+
+        # Aplica o nível k só depois de relaxar toda a fronteira (no máximo 1 hop a mais).
+        for v, custo in novos_custos.items():
+            custos[v] = custo
+        pais.append(novos_pais)
+        fronteira = list(novos_custos)
+
+        if destino in novos_custos:
+            caminho = _caminho_do_nivel(pais, origem, destino, k)
+        resultado.append((custos[destino], len(caminho) - 1 if caminho else None, caminho))
+
+        # Sem fronteira, nenhum nível seguinte muda a resposta.
+        if not fronteira:
+            for _ in range(k + 1, max_hops + 1):
+                resultado.append(resultado[-1])
+            break
+
+    return resultado
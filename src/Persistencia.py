@@ -0,0 +1,161 @@
+# -----------------------------------------------------------------------------------------
+# Persistencia.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo grava e abre a rede social em formato binário compacto (mapeado com mmap).
+
+# Formato do arquivo (ordem de bytes nativa da máquina, seções alinhadas em 8 bytes):
+# - cabeçalho (64 bytes): assinatura, versão, ordem de bytes, V, E, friccao_alpha
+# - offsets     int64   [V + 1]   faixa das arestas de cada vértice (CSR)
+# - destinos    int32   [E]       vizinhos ordenados por vértice
+# - friccao     float64 [E]       peso de fricção de cada aresta
+# - interacao   int32   [E]       interação bruta de cada aresta
+# - comunidade  int32   [V]       comunidade_por_no
+# A camada "saltos" não é gravada: é peso 1 em todas as arestas.
+#
+# Na abertura, cada seção vira um memoryview sobre o mmap: nada é lido nem copiado para
+# listas Python, e vários processos abrindo o mesmo arquivo compartilham as páginas.
+
+import mmap
+import struct
+import sys
+from array import array
+
+from Grafo import GrafoCSR
+
+# Assinatura e versão do formato.
+ASSINATURA = b"RSGRAFO\0"
+VERSAO = 1
+
+# assinatura, versão, ordem de bytes (0 = little, 1 = big), V, E, friccao_alpha
+_CABECALHO = struct.Struct("<8sIIQQd")
+_TAMANHO_CABECALHO = 64
+
+
+# Função interna que completa com zeros até o próximo múltiplo de 8 bytes.
+def _alinhar(arquivo):
+    resto = arquivo.tell() % 8
+    if resto:
+        arquivo.write(b"\0" * (8 - resto))
+
+
+# Grava um GrafoCamadas (ex.: de gerar_rede_social_camadas) + comunidade_por_no no formato binário.
+def salvar_grafo(caminho_arquivo, grafo, comunidade_por_no, friccao_alpha=0.0):
+    num_vertices = grafo.ordem()
+    friccao = grafo.pesos["friccao"]
+    interacao = grafo.pesos["interacao"]
+
+    # Ordem das arestas de cada vértice (por destino), a mesma do GrafoCSR.
+    ordens = [sorted(range(grafo.grau(v)), key=grafo.lista[v].__getitem__) for v in range(num_vertices)]
+
+    with open(caminho_arquivo, "wb") as arquivo:
+        ordem_bytes = 0 if sys.byteorder == "little" else 1
+        cabecalho = _CABECALHO.pack(ASSINATURA, VERSAO, ordem_bytes, num_vertices, grafo.tamanho(), friccao_alpha)
+        arquivo.write(cabecalho.ljust(_TAMANHO_CABECALHO, b"\0"))
+
+        # offsets (int64)
+        offsets = array("q", [0]) * (num_vertices + 1)
+        for v in range(num_vertices):
+            offsets[v + 1] = offsets[v] + grafo.grau(v)
+        offsets.tofile(arquivo)
+
+        # Seções por aresta: grava vértice a vértice para não montar vetores do tamanho de E.
+        for tipo, valores in (("i", grafo.lista), ("d", friccao), ("i", interacao)):
+            for v in range(num_vertices):
+                linha = valores[v]
+                array(tipo, [linha[i] for i in ordens[v]]).tofile(arquivo)
+            _alinhar(arquivo)
+
+        # comunidade_por_no (int32)
+        array("i", comunidade_por_no).tofile(arquivo)
+
+
+# Grafo aberto de um arquivo binário: vetores são memoryviews sobre o mmap (sem cópia).
+class GrafoMapeado:
+    def __init__(self, caminho_arquivo):
+        with open(caminho_arquivo, "rb") as arquivo:
+            self.mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        assinatura, versao, ordem_bytes, num_vertices, num_arestas, friccao_alpha = _CABECALHO.unpack_from(self.mapa, 0)
+        if assinatura != ASSINATURA or versao != VERSAO:
+            self.mapa.close()
+            raise ValueError(f"Arquivo de grafo inválido: {caminho_arquivo}")
+        if ordem_bytes != (0 if sys.byteorder == "little" else 1):
+            self.mapa.close()
+            raise ValueError("Arquivo de grafo gravado com outra ordem de bytes")
+
+        self.numVertices = num_vertices
+        self.numArestas = num_arestas
+        self.friccao_alpha = friccao_alpha
+
+        # Recorta cada seção do mmap como memoryview tipado.
+        self._buffer = memoryview(self.mapa)
+        self._secoes = []
+        posicao = _TAMANHO_CABECALHO
+        self.offsets, posicao = self._secao(posicao, "q", num_vertices + 1)
+        self.destinos, posicao = self._secao(posicao, "i", num_arestas)
+        friccao, posicao = self._secao(posicao, "d", num_arestas)
+        interacao, posicao = self._secao(posicao, "i", num_arestas)
+        self.comunidade_por_no, posicao = self._secao(posicao, "i", num_vertices)
+
+        # Camadas com a API de ListaAdjacencias, todas sobre os mesmos offsets/destinos.
+        self.camadas = {
+            "saltos": GrafoCSR.deVetores(self.offsets, self.destinos),
+            "friccao": GrafoCSR.deVetores(self.offsets, self.destinos, friccao),
+            "interacao": GrafoCSR.deVetores(self.offsets, self.destinos, interacao),
+        }
+
+    def _secao(self, posicao, tipo, quantidade):
+        tamanho = array(tipo).itemsize * quantidade
+        secao = self._buffer[posicao:posicao + tamanho].cast(tipo)
+        self._secoes.append(secao)
+
+        # Próxima seção começa alinhada em 8 bytes.
+        posicao += tamanho
+        posicao += (8 - posicao % 8) % 8
+        return secao, posicao
+
+    def ordem(self):
+        return self.numVertices
+
+    def tamanho(self):
+        return self.numArestas
+
+    def camada(self, nome):
+        if nome not in self.camadas:
+            raise KeyError(f"Camada inexistente: {nome}")
+        return self.camadas[nome]
+
+    def fechar(self):
+        """
+        Libera as visões e fecha o mmap. Depois de fechar() o grafo não deve mais ser usado.
+
+        vizinhos() das camadas devolve fatias das visões (sem cópia). Se alguma fatia (ou
+        iterador sobre ela) ainda estiver viva, o mmap não pode ser fechado agora: as
+        referências do grafo são descartadas e o mapeamento é liberado pelo coletor quando
+        a última fatia deixar de existir.
+        """
+        if self.mapa is None:
+            return
+        self.camadas = {}
+        try:
+            for secao in self._secoes:
+                secao.release()
+            self._buffer.release()
+            self.mapa.close()
+        except BufferError:
+            # Ainda há fatias exportadas: o fechamento fica para a coleta.
+            pass
+        self._secoes = []
+        self._buffer = None
+        self.mapa = None
+        self.offsets = self.destinos = self.comunidade_por_no = None
+
+
+# Abre um arquivo gravado por salvar_grafo.
+def carregar_grafo(caminho_arquivo):
+    return GrafoMapeado(caminho_arquivo)
@@ -16,9 +16,14 @@
 # Objetivo do experimento:
 # - Comparar menor número de saltos (peso=1) vs menor fricção (peso calculado)
 # São gerados dois grafos: um para hops e outro para custo de repasse.
+# (gerar_rede_social_camadas gera a mesma rede em um único grafo com camadas de peso.)
 
 import random
-from Grafo import ListaAdjacencias
+from math import log
+from Grafo import ListaAdjacencias, GrafoCamadas
+
+# Nomes das camadas de peso usadas por gerar_rede_social_camadas.
+CAMADAS_REDE_SOCIAL = ("saltos", "friccao", "interacao")
 
 # Função interna que calcula o peso (custo) de uma aresta no grafo de fricção.
 def _peso_friccao(interacao, friccao_alpha):
@@ -39,33 +44,8 @@ def _peso_friccao(interacao, friccao_alpha):
     """
     return 1.0 + (float(friccao_alpha) / (1.0 + float(interacao)))
 
-# Função pública do módulo que gera a rede social e retorna os dois grafos + mapa de comunidades.
-def gerar_rede_social(
-    num_vertices=4000,              # Quantidade total de nós (Usuários).
-    num_comunidades=4,              # Quantidade de comunidades (blocos).
-    p_intra=0.06,                   # Probabilidade de aresta dentro de uma comunidade.
-    p_inter=0.0005,                 # Fator de amostragem de pontes entre comunidades.
-    max_pontes_por_par=10,          # Limite de pontes entre cada par de comunidades.
-    seed=42,                        # Seed para reprodutibilidade.
-    interacao_intra_min=20,         # Interação mínima intra-comunidade.
-    interacao_intra_max=100,        # Interação máxima intra-comunidade.
-    interacao_inter_min=0,          # Interação mínima inter-comunidade.
-    interacao_inter_max=5,          # Interação máxima inter-comunidade.
-    friccao_alpha=8.0               # Intensidade do custo de fricção.
-):
-    """
-    Docstring explicativa do gerador.
-
-    Retorna:
-    - grafo_friccao, grafo_saltos, comunidade_por_no
-    """
-
-    rnd = random.Random(seed)
-
-    # Garante pelo menos 2 comunidades para existir “inter-comunidade”.
-    if num_comunidades < 2:
-        num_comunidades = 2
-
+# Função interna que distribui os nós em comunidades (blocos contíguos por faixa de índice).
+def _distribuir_comunidades(num_vertices, num_comunidades):
     # Inicializa vetor nó->comunidade com zeros.
     comunidade_por_no = [0] * num_vertices
 
@@ -87,42 +67,56 @@ def gerar_rede_social(
         # Adiciona o nó na lista da comunidade correspondente.
         nos_por_comunidade[c].append(no)
 
-    # Cria grafo de fricção (ponderado) com N vértices.
-    grafo_friccao = ListaAdjacencias(num_vertices)
-
-    # Cria grafo baseline (peso 1) com N vértices.
-    grafo_saltos = ListaAdjacencias(num_vertices)
-
-    # Set para controlar arestas não-direcionadas (evita duplicidade u-v).
-    arestas_undirected = set()
+    return comunidade_por_no, nos_por_comunidade
 
-    # Função interna para adicionar uma aresta “não-direcionada” (duplica u->v e v->u).
-    def add_aresta_undirected(u, v, interacao):
-        # Ignora laço (aresta do nó para ele mesmo).
-        if u == v:
-            return
 
-        # Normaliza ordem (a,b) para representar a aresta não-direcionada.
-        a = u if u < v else v
-        b = v if u < v else u
-
-        # Se a aresta já foi adicionada, não adiciona de novo.
-        if (a, b) in arestas_undirected:
-            return
-
-        # Registra a aresta como existente no set de controle.
-        arestas_undirected.add((a, b))
-
-        # Calcula o peso de fricção baseado na interação e no alpha.
-        peso = _peso_friccao(interacao, friccao_alpha)
-
-        # Como o grafo é NÃO-direcionado, adiciona as duas direções no grafo de fricção.
-        grafo_friccao.addAresta(u, v, peso)
-        grafo_friccao.addAresta(v, u, peso)
-
-        # No baseline, o peso é 1 em ambas direções (hops).
-        grafo_saltos.addAresta(u, v, 1)
-        grafo_saltos.addAresta(v, u, 1)
+# Função interna que sorteia os pares (u, v) de um bloco G(n, p) por saltos geométricos.
+def _pares_por_salto_geometrico(rnd, nos, p):
+    """
+    Em vez de sortear rnd.random() para cada um dos n(n-1)/2 pares, sorteia quantos
+    pares são pulados até a próxima aresta: salto ~ Geométrica(p). Cada par (w, v)
+    com w < v é visitado no máximo uma vez, então não há duplicidade.
+    Custo proporcional ao número de arestas geradas, não ao número de pares.
+    """
+    n = len(nos)
+    if p <= 0 or n < 2:
+        return
+
+    # p >= 1: todos os pares viram aresta.
+    if p >= 1:
+        for j in range(1, n):
+            for i in range(j):
+                yield nos[i], nos[j]
+        return
+
+    log_q = log(1.0 - p)
+
+    # Pares enumerados linha a linha: (w, v) com 0 <= w < v < n.
+    v = 1
+    w = -1
+    while v < n:
+        # Quantidade de pares pulados antes da próxima aresta.
+        w += 1 + int(log(1.0 - rnd.random()) / log_q)
+
+        # Avança as linhas consumidas pelo salto.
+        while w >= v and v < n:
+            w -= v
+            v += 1
+
+        if v < n:
+            yield nos[w], nos[v]
+
+
+# Função interna que sorteia as arestas (u, v, interacao) na ordem do gerador.
+# A ordem das chamadas a rnd é a mesma para todos os consumidores (mesma seed => mesma rede).
+# Cada aresta não-direcionada é entregue uma única vez: pares (i, j>i) dentro do bloco e
+# um set local (limitado a max_pontes_por_par) para as pontes de cada par de comunidades.
+def _gerar_arestas(
+    rnd, nos_por_comunidade, p_intra, p_inter, max_pontes_por_par,
+    interacao_intra_min, interacao_intra_max, interacao_inter_min, interacao_inter_max,
+    geracao_rapida=False
+):
+    num_comunidades = len(nos_por_comunidade)
 
     # -----------------------------
     # 1) Arestas intra-comunidade (densas)
@@ -135,6 +129,15 @@ def gerar_rede_social(
         # Quantidade de nós no bloco.
         n = len(nos)
 
+        # Modo rápido: pula diretamente para o próximo par sorteado (mesma distribuição G(n,p)).
+        if geracao_rapida:
+            # Interação uniforme em [min, max] sem o custo de rnd.randint por aresta.
+            faixa = interacao_intra_max - interacao_intra_min + 1
+            for u, v in _pares_por_salto_geometrico(rnd, nos, p_intra):
+                interacao = interacao_intra_min + int(rnd.random() * faixa)
+                yield u, v, interacao
+            continue
+
         # Duplo loop para pares (u,v) dentro do bloco, sem repetir pares.
         for i in range(n):
             # Nó u na posição i.
@@ -148,8 +151,8 @@ def gerar_rede_social(
                     # Define a interação intra como alta (forte).
                     interacao = rnd.randint(interacao_intra_min, interacao_intra_max)
 
-                    # Adiciona aresta não-direcionada nos dois grafos.
-                    add_aresta_undirected(u, v, interacao)
+                    # Entrega a aresta não-direcionada ao consumidor.
+                    yield u, v, interacao
 
     # -----------------------------
     # 2) Arestas inter-comunidade (pontes fracas e mais realistas)
@@ -174,6 +177,9 @@ def gerar_rede_social(
             if alvo > max_pontes_por_par:
                 alvo = max_pontes_por_par
 
+            # Pontes já entregues neste par de comunidades (no máximo "alvo" entradas).
+            pontes = set()
+
             # Cria "alvo" pontes amostrando aleatoriamente pares (u,v) entre comunidades.
             for _ in range(alvo):
                 # Seleciona u aleatório dentro de nos1.
@@ -185,8 +191,233 @@ def gerar_rede_social(
                 # Interação inter é baixa (ponte fraca).
                 interacao = rnd.randint(interacao_inter_min, interacao_inter_max)
 
-                # Adiciona aresta não-direcionada nos dois grafos (fricção e saltos).
-                add_aresta_undirected(u, v, interacao)
+                # Par repetido: descarta (o sorteio de rnd continua igual, mantendo a seed).
+                if (u, v) in pontes:
+                    continue
+                pontes.add((u, v))
+
+                # Entrega a aresta não-direcionada ao consumidor.
+                yield u, v, interacao
+
+# Função pública do módulo que gera a rede social e retorna os dois grafos + mapa de comunidades.
+def gerar_rede_social(
+    num_vertices=4000,              # Quantidade total de nós (Usuários).
+    num_comunidades=4,              # Quantidade de comunidades (blocos).
+    p_intra=0.06,                   # Probabilidade de aresta dentro de uma comunidade.
+    p_inter=0.0005,                 # Fator de amostragem de pontes entre comunidades.
+    max_pontes_por_par=10,          # Limite de pontes entre cada par de comunidades.
+    seed=42,                        # Seed para reprodutibilidade.
+    interacao_intra_min=20,         # Interação mínima intra-comunidade.
+    interacao_intra_max=100,        # Interação máxima intra-comunidade.
+    interacao_inter_min=0,          # Interação mínima inter-comunidade.
+    interacao_inter_max=5,          # Interação máxima inter-comunidade.
+    friccao_alpha=8.0,              # Intensidade do custo de fricção.
+    geracao_rapida=False            # Sorteio intra por saltos geométricos (outra rede, mesma distribuição).
+):
+    """
+    Docstring explicativa do gerador.
+
+    geracao_rapida=True troca o sorteio par a par dentro das comunidades por saltos
+    geométricos: mesma distribuição G(n, p) por bloco, determinística pela seed, mas
+    com custo proporcional ao número de arestas (a rede gerada é outra).
+
+    Retorna:
+    - grafo_friccao, grafo_saltos, comunidade_por_no
+    """
+
+    rnd = random.Random(seed)
+
+    # Garante pelo menos 2 comunidades para existir “inter-comunidade”.
+    if num_comunidades < 2:
+        num_comunidades = 2
+
+    # Distribui os nós nas comunidades.
+    comunidade_por_no, nos_por_comunidade = _distribuir_comunidades(num_vertices, num_comunidades)
+
+    # Cria grafo de fricção (ponderado) com N vértices.
+    # O índice de arestas dele rejeita duplicatas (dispensa um set global de pares).
+    grafo_friccao = ListaAdjacencias(num_vertices, indexado=True)
+
+    # Cria grafo baseline (peso 1) com N vértices.
+    # Também indexado: possuiAresta em O(log grau) para quem recebe só o grafo de saltos.
+    grafo_saltos = ListaAdjacencias(num_vertices, indexado=True)
+
+    # Função interna para adicionar uma aresta “não-direcionada” (duplica u->v e v->u).
+    def add_aresta_undirected(u, v, interacao):
+        # Ignora laço (aresta do nó para ele mesmo).
+        if u == v:
+            return
+
+        # Calcula o peso de fricção baseado na interação e no alpha.
+        peso = _peso_friccao(interacao, friccao_alpha)
+
+        # Se a aresta já foi adicionada, o índice rejeita (u->v existe <=> v->u existe).
+        if not grafo_friccao.addAresta(u, v, peso):
+            return
+
+        # Como o grafo é NÃO-direcionado, adiciona também a direção inversa no grafo de fricção.
+        grafo_friccao.addAresta(v, u, peso)
+
+        # No baseline, o peso é 1 em ambas direções (hops).
+        grafo_saltos.addAresta(u, v, 1)
+        grafo_saltos.addAresta(v, u, 1)
+
+    # Sorteia as arestas intra-comunidade (densas) e inter-comunidade (pontes fracas).
+    for u, v, interacao in _gerar_arestas(
+        rnd, nos_por_comunidade, p_intra, p_inter, max_pontes_por_par,
+        interacao_intra_min, interacao_intra_max, interacao_inter_min, interacao_inter_max,
+        geracao_rapida
+    ):
+        # Adiciona aresta não-direcionada nos dois grafos (fricção e saltos).
+        add_aresta_undirected(u, v, interacao)
 
     # Retorna os dois grafos e o vetor comunidade_por_no.
-    return grafo_friccao, grafo_saltos, comunidade_por_no
\ No newline at end of file
+    return grafo_friccao, grafo_saltos, comunidade_por_no
+
+# Variante que guarda a topologia uma única vez, com camadas de peso nomeadas.
+def gerar_rede_social_camadas(
+    num_vertices=4000,              # Quantidade total de nós (Usuários).
+    num_comunidades=4,              # Quantidade de comunidades (blocos).
+    p_intra=0.06,                   # Probabilidade de aresta dentro de uma comunidade.
+    p_inter=0.0005,                 # Fator de amostragem de pontes entre comunidades.
+    max_pontes_por_par=10,          # Limite de pontes entre cada par de comunidades.
+    seed=42,                        # Seed para reprodutibilidade.
+    interacao_intra_min=20,         # Interação mínima intra-comunidade.
+    interacao_intra_max=100,        # Interação máxima intra-comunidade.
+    interacao_inter_min=0,          # Interação mínima inter-comunidade.
+    interacao_inter_max=5,          # Interação máxima inter-comunidade.
+    friccao_alpha=8.0,              # Intensidade do custo de fricção.
+    geracao_rapida=False            # Sorteio intra por saltos geométricos (outra rede, mesma distribuição).
+):
+    """
+    Mesma rede de gerar_rede_social (mesma seed => mesmas arestas, na mesma ordem),
+    mas em um único GrafoCamadas com as camadas:
+    - "saltos": peso 1
+    - "friccao": peso calculado por _peso_friccao
+    - "interacao": valor bruto de interação
+    geracao_rapida tem o mesmo significado que em gerar_rede_social.
+
+    Retorna:
+    - grafo, comunidade_por_no   (use grafo.camada("friccao") / grafo.camada("saltos"))
+    """
+
+    rnd = random.Random(seed)
+
+    # Garante pelo menos 2 comunidades para existir “inter-comunidade”.
+    if num_comunidades < 2:
+        num_comunidades = 2
+
+    # Distribui os nós nas comunidades.
+    comunidade_por_no, nos_por_comunidade = _distribuir_comunidades(num_vertices, num_comunidades)
+
+    # Grafo único com as três camadas de peso; o índice de arestas rejeita duplicatas.
+    grafo = GrafoCamadas(num_vertices, CAMADAS_REDE_SOCIAL, indexado=True)
+
+    for u, v, interacao in _gerar_arestas(
+        rnd, nos_por_comunidade, p_intra, p_inter, max_pontes_por_par,
+        interacao_intra_min, interacao_intra_max, interacao_inter_min, interacao_inter_max,
+        geracao_rapida
+    ):
+        # Ignora laço e aresta repetida (mesma regra de add_aresta_undirected).
+        if u == v:
+            continue
+
+        # Adiciona as duas direções com os pesos de todas as camadas.
+        peso = _peso_friccao(interacao, friccao_alpha)
+        if grafo.addAresta(u, v, saltos=1, friccao=peso, interacao=interacao):
+            grafo.addAresta(v, u, saltos=1, friccao=peso, interacao=interacao)
+
+    return grafo, comunidade_por_no
+
+
+# Gerador em fluxo (streaming): entrega as arestas (u, v, interacao) em blocos, sem montar grafo.
+def gerar_arestas_em_blocos(
+    num_vertices=4000,              # Quantidade total de nós (Usuários).
+    num_comunidades=4,              # Quantidade de comunidades (blocos).
+    p_intra=0.06,                   # Probabilidade de aresta dentro de uma comunidade.
+    p_inter=0.0005,                 # Fator de amostragem de pontes entre comunidades.
+    max_pontes_por_par=10,          # Limite de pontes entre cada par de comunidades.
+    seed=42,                        # Seed para reprodutibilidade.
+    interacao_intra_min=20,         # Interação mínima intra-comunidade.
+    interacao_intra_max=100,        # Interação máxima intra-comunidade.
+    interacao_inter_min=0,          # Interação mínima inter-comunidade.
+    interacao_inter_max=5,          # Interação máxima inter-comunidade.
+    geracao_rapida=False,           # Sorteio intra por saltos geométricos.
+    tamanho_bloco=100000            # Quantidade de arestas por bloco entregue.
+):
+    """
+    Mesmas arestas de gerar_rede_social (mesma seed e parâmetros), cada aresta
+    não-direcionada uma única vez, em listas de até tamanho_bloco tuplas (u, v, interacao).
+
+    Não guarda set global de arestas nem grafo: a memória fica limitada a um bloco
+    (mais O(V) para as listas de comunidades). O mapa nó->comunidade pode ser obtido
+    com comunidades_por_no(num_vertices, num_comunidades).
+    """
+
+    rnd = random.Random(seed)
+
+    # Garante pelo menos 2 comunidades para existir “inter-comunidade”.
+    if num_comunidades < 2:
+        num_comunidades = 2
+
+    _, nos_por_comunidade = _distribuir_comunidades(num_vertices, num_comunidades)
+
+    bloco = []
+    for aresta in _gerar_arestas(
+        rnd, nos_por_comunidade, p_intra, p_inter, max_pontes_por_par,
+        interacao_intra_min, interacao_intra_max, interacao_inter_min, interacao_inter_max,
+        geracao_rapida
+    ):
+        bloco.append(aresta)
+        if len(bloco) >= tamanho_bloco:
+            yield bloco
+            bloco = []
+
+    if bloco:
+        yield bloco
+
+
+# Mapa nó->comunidade usado pelos geradores (blocos contíguos por faixa de índice).
+def comunidades_por_no(num_vertices, num_comunidades):
+    if num_comunidades < 2:
+        num_comunidades = 2
+    comunidade_por_no, _ = _distribuir_comunidades(num_vertices, num_comunidades)
+    return comunidade_por_no
+
+
+# Grava um fluxo de blocos de arestas em arquivo texto ("u v interacao" por linha).
+def salvar_arestas(caminho_arquivo, blocos):
+    total = 0
+    with open(caminho_arquivo, "w", encoding="utf-8") as arquivo:
+        for bloco in blocos:
+            arquivo.write("".join(f"{u} {v} {interacao}\n" for u, v, interacao in bloco))
+            total += len(bloco)
+
+    # Retorna a quantidade de arestas gravadas.
+    return total
+
+
+# Lê um arquivo gravado por salvar_arestas, entregando blocos de (u, v, interacao).
+def carregar_arestas(caminho_arquivo, tamanho_bloco=100000):
+    bloco = []
+    with open(caminho_arquivo, "r", encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            u, v, interacao = linha.split()
+            bloco.append((int(u), int(v), int(interacao)))
+            if len(bloco) >= tamanho_bloco:
+                yield bloco
+                bloco = []
+
+    if bloco:
+        yield bloco
+
+
+# Monta um GrafoCamadas (saltos, friccao, interacao) a partir de um fluxo de blocos de arestas.
+def construir_grafo_camadas(num_vertices, blocos, friccao_alpha=8.0):
+    grafo = GrafoCamadas(num_vertices, CAMADAS_REDE_SOCIAL)
+    for bloco in blocos:
+        for u, v, interacao in bloco:
+            peso = _peso_friccao(interacao, friccao_alpha)
+            grafo.addAresta(u, v, saltos=1, friccao=peso, interacao=interacao)
+            grafo.addAresta(v, u, saltos=1, friccao=peso, interacao=interacao)
+    return grafo
@@ -0,0 +1,249 @@
+# -----------------------------------------------------------------------------------------
+# Sobreposicao.py
+#
+# Link para Repositorio do Projeto no GitHub
+#
+# https://github.com/luccas00/TP2_AEDs_III
+#
+# -----------------------------------------------------------------------------------------
+# Este arquivo implementa um índice de roteamento em dois níveis usando as comunidades.
+
+# A rede é formada por blocos densos (comunidades) ligados por poucas pontes. Então:
+# - nós de fronteira: extremos de pontes (vizinhos em outra comunidade)
+# - tabela por comunidade: para cada nó de fronteira b, a árvore de caminhos mínimos de b
+#   restrita à comunidade (distância e predecessor de TODO nó do bloco, em array)
+# - grafo de sobreposição: os nós de fronteira, ligados pelas pontes originais e, dentro de
+#   cada comunidade, pelas distâncias da tabela (clique entre os nós de fronteira)
+# Consulta entre comunidades A -> B: a origem entra na sobreposição pelas distâncias das
+# tabelas de A (sem busca local), Dijkstra na sobreposição (poucos nós) e saída pelas
+# tabelas de B. O caminho é desempacotado pelas árvores guardadas.
+# Consultas dentro da mesma comunidade comparam a busca local com a rota pela sobreposição.
+# Mudança de peso: só a tabela do bloco afetado é recalculada (ponte: só as listas de pontes).
+# Pressupõe grafo não-direcionado (dist(x, b) = dist(b, x)), como os de RedeSocial.py.
+
+from array import array
+from heapq import heappush, heappop
+from time import perf_counter
+
+from Algoritmos import INF
+
+
+class IndiceSobreposicao:
+    def __init__(self, grafo, comunidade_por_no):
+        inicio = perf_counter()
+        self.grafo = grafo
+        self.comunidade_por_no = comunidade_por_no
+
+        # Nós de cada comunidade e posição local de cada nó dentro do seu bloco.
+        self.nos_por_comunidade = {}
+        self.posicao_local = [0] * grafo.numVertices
+        for v, c in enumerate(comunidade_por_no):
+            nos = self.nos_por_comunidade.setdefault(c, [])
+            self.posicao_local[v] = len(nos)
+            nos.append(v)
+
+        # pontes[b] = [(vizinho em outra comunidade, peso)], só para nós de fronteira.
+        self.pontes = {}
+        # fronteira[c] = nós de fronteira da comunidade c.
+        self.fronteira = {c: [] for c in self.nos_por_comunidade}
+        # tabelas[c][b] = (distancias, predecessores) locais da árvore de b no bloco c.
+        self.tabelas = {}
+
+        for v in range(grafo.numVertices):
+            self._atualizar_pontes(v)
+        for c in self.nos_por_comunidade:
+            self.recalcular_comunidade(c)
+
+        self.tempo_preprocessamento = perf_counter() - inicio
+
+    # -----------------------------
+    # Construção e atualização
+    # -----------------------------
+    def _atualizar_pontes(self, v):
+        # Recalcula as pontes de v; retorna True se v entrou ou saiu da fronteira.
+        c = self.comunidade_por_no[v]
+        pontes = [(u, peso) for (u, peso) in self.grafo.vizinhos(v) if self.comunidade_por_no[u] != c]
+        era_fronteira = v in self.pontes
+        if pontes:
+            self.pontes[v] = pontes
+            if not era_fronteira:
+                self.fronteira[c].append(v)
+        elif era_fronteira:
+            del self.pontes[v]
+            self.fronteira[c].remove(v)
+        return era_fronteira != bool(pontes)
+
+    def _arvore_local(self, c, raiz):
+        # Dijkstra a partir de raiz sem sair da comunidade c (vetores na posição local).
+        nos = self.nos_por_comunidade[c]
+        posicao = self.posicao_local
+        comunidade = self.comunidade_por_no
+        distancias = array("d", [INF]) * len(nos)
+        predecessores = array("i", [-1]) * len(nos)
+        distancias[posicao[raiz]] = 0
+        predecessores[posicao[raiz]] = raiz
+        heap = [(0, raiz)]
+        while heap:
+            distancia_atual, v = heappop(heap)
+            if distancia_atual > distancias[posicao[v]]:
+                continue
+            for (u, peso) in self.grafo.vizinhos(v):
+                if comunidade[u] != c:
+                    continue
+                alternativa = distancia_atual + peso
+                if alternativa < distancias[posicao[u]]:
+                    distancias[posicao[u]] = alternativa
+                    predecessores[posicao[u]] = v
+                    heappush(heap, (alternativa, u))
+        return distancias, predecessores
+
+    def recalcular_comunidade(self, c):
+        # Tabela do bloco c: uma árvore local por nó de fronteira.
+        self.tabelas[c] = {b: self._arvore_local(c, b) for b in self.fronteira[c]}
+
+    def atualizar_aresta(self, u, v):
+        """
+        Chamar depois de alterar/inserir/remover a aresta u-v no grafo.
+        Aresta interna: recalcula só a tabela daquele bloco. Ponte: atualiza as pontes dos
+        extremos (e a tabela do bloco cuja fronteira mudou, se for o caso).
+        """
+        cu = self.comunidade_por_no[u]
+        cv = self.comunidade_por_no[v]
+        if cu == cv:
+            self.recalcular_comunidade(cu)
+            return
+        if self._atualizar_pontes(u):
+            self.recalcular_comunidade(cu)
+        if self._atualizar_pontes(v):
+            self.recalcular_comunidade(cv)
+
+    # -----------------------------
+    # Consulta
+    # -----------------------------
+    def _distancia_tabela(self, b, x):
+        # Distância entre nó de fronteira b e x dentro do bloco de b (INF se x for de outro bloco).
+        c = self.comunidade_por_no[b]
+        if self.comunidade_por_no[x] != c:
+            return INF
+        return self.tabelas[c][b][0][self.posicao_local[x]]
+
+    def _trecho_ate_fronteira(self, x, b):
+        # Caminho x -> b dentro do bloco, seguindo a árvore local de b.
+        predecessores = self.tabelas[self.comunidade_por_no[b]][b][1]
+        caminho = [x]
+        while x != b:
+            x = predecessores[self.posicao_local[x]]
+            caminho.append(x)
+        return caminho
+
+    def _busca_local(self, origem, destino):
+        # Dijkstra ponto a ponto sem sair do bloco (consultas intra-comunidade).
+        c = self.comunidade_por_no[origem]
+        comunidade = self.comunidade_por_no
+        distancias = {origem: 0}
+        anteriores = {origem: None}
+        heap = [(0, origem)]
+        while heap:
+            distancia_atual, v = heappop(heap)
+            if distancia_atual > distancias[v]:
+                continue
+            if v == destino:
+                caminho = []
+                while v is not None:
+                    caminho.append(v)
+                    v = anteriores[v]
+                caminho.reverse()
+                return distancia_atual, caminho
+            for (u, peso) in self.grafo.vizinhos(v):
+                if comunidade[u] != c:
+                    continue
+                alternativa = distancia_atual + peso
+                if alternativa < distancias.get(u, INF):
+                    distancias[u] = alternativa
+                    anteriores[u] = v
+                    heappush(heap, (alternativa, u))
+        return INF, []
+
+    def consultar(self, origem, destino):
+        """Retorna (custo, caminho); (INF, []) se não houver caminho."""
+        if origem == destino:
+            return 0, [origem]
+        comunidade = self.comunidade_por_no
+        c_origem = comunidade[origem]
+        c_destino = comunidade[destino]
+
+        melhor_custo, melhor_caminho = INF, []
+        if c_origem == c_destino:
+            melhor_custo, melhor_caminho = self._busca_local(origem, destino)
+
+        # Dijkstra na sobreposição; a origem entra pelas distâncias da tabela do seu bloco.
+        distancias = {}
+        anteriores = {}
+        heap = []
+        for b in self.fronteira[c_origem]:
+            d = self._distancia_tabela(b, origem)
+            if d < distancias.get(b, INF):
+                distancias[b] = d
+                anteriores[b] = None
+                heappush(heap, (d, b))
+
+        fechados = set()
+        saida = None
+        while heap:
+            distancia_atual, b = heappop(heap)
+            if distancia_atual >= melhor_custo:
+                break
+            if b in fechados:
+                continue
+            fechados.add(b)
+            c = comunidade[b]
+
+            # Saída para o destino pela tabela do bloco de destino.
+            if c == c_destino:
+                candidato = distancia_atual + self._distancia_tabela(b, destino)
+                if candidato < melhor_custo:
+                    melhor_custo = candidato
+                    saida = b
+
+            # Arestas da sobreposição: clique do bloco (tabela) e pontes originais.
+            posicao_b = self.posicao_local[b]
+            vizinhos = [(b2, tabela[0][posicao_b]) for b2, tabela in self.tabelas[c].items() if b2 != b]
+            vizinhos.extend(self.pontes[b])
+            for (b2, peso) in vizinhos:
+                alternativa = distancia_atual + peso
+                if alternativa < distancias.get(b2, INF):
+                    distancias[b2] = alternativa
+                    anteriores[b2] = b
+                    heappush(heap, (alternativa, b2))
+
+        if saida is None:
+            return melhor_custo, melhor_caminho
+
+        # Desempacota: origem -> 1a fronteira, trechos da sobreposição, última fronteira -> destino.
+        sequencia = []
+        b = saida
+        while b is not None:
+            sequencia.append(b)
+            b = anteriores[b]
+        sequencia.reverse()
+
+        caminho = self._trecho_ate_fronteira(origem, sequencia[0])
+        for anterior, proximo in zip(sequencia, sequencia[1:]):
+            if comunidade[anterior] == comunidade[proximo]:
+                caminho.extend(self._trecho_ate_fronteira(anterior, proximo)[1:])
+            else:
+                caminho.append(proximo)
+        trecho_final = self._trecho_ate_fronteira(destino, saida)
+        trecho_final.reverse()
+        caminho.extend(trecho_final[1:])
+        return melhor_custo, caminho
+
+    def memoriaBytes(self):
+        total = 0
+        for tabela in self.tabelas.values():
+            for distancias, predecessores in tabela.values():
+                total += distancias.itemsize * len(distancias) + predecessores.itemsize * len(predecessores)
+        return total
+
+    def num_fronteira(self):
+        return sum(len(nos) for nos in self.fronteira.values())